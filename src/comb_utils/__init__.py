@@ -1,14 +1,45 @@
-"""Top-level init."""
-
-from comb_utils.lib import (
-    BaseCaller,
-    BaseDeleteCaller,
-    BaseGetCaller,
-    BasePagedResponseGetter,
-    BasePostCaller,
-    DocString,
-    ErrorDocString,
-    concat_response_pages,
-    get_response_dict,
-    get_responses,
-)
+"""Top-level init.
+
+Exports are imported from :py:mod:`comb_utils.lib` on first access (PEP 562).
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from comb_utils import lib
+
+if TYPE_CHECKING:
+    from comb_utils.lib import (
+        BaseBatchedPostCaller,
+        BaseCaller,
+        BaseDeleteCaller,
+        BaseGetCaller,
+        BasePagedResponseGetter,
+        BasePostCaller,
+        ConcurrencyController,
+        DocString,
+        ErrorDocString,
+        TokenBucket,
+        concat_response_pages,
+        concat_response_pages_arrow,
+        get_response_dict,
+        get_responses,
+        iter_responses,
+    )
+
+__all__ = list(lib.__all__)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export from :py:mod:`comb_utils.lib` on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(lib, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including exports not yet imported."""
+    return sorted({*globals(), *__all__})
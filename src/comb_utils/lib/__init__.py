@@ -1,13 +1,62 @@
-"""lib init."""
-
-from comb_utils.lib.api_callers import (
-    BaseCaller,
-    BaseDeleteCaller,
-    BaseGetCaller,
-    BasePagedResponseGetter,
-    BasePostCaller,
-    concat_response_pages,
-    get_response_dict,
-    get_responses,
-)
-from comb_utils.lib.docs import DocString, ErrorDocString
+"""lib init.
+
+Exports are imported from their modules on first access (PEP 562), so importing the package
+doesn't import the HTTP clients until a caller is used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from comb_utils.lib.api_callers import (
+        BaseBatchedPostCaller,
+        BaseCaller,
+        BaseDeleteCaller,
+        BaseGetCaller,
+        BasePagedResponseGetter,
+        BasePostCaller,
+        concat_response_pages,
+        concat_response_pages_arrow,
+        get_response_dict,
+        get_responses,
+        iter_responses,
+    )
+    from comb_utils.lib.docs import DocString, ErrorDocString
+    from comb_utils.lib.rate_control import ConcurrencyController, TokenBucket
+
+#: The module each export is imported from.
+_EXPORT_MODULES: Final[dict[str, str]] = {
+    "BaseBatchedPostCaller": "comb_utils.lib.api_callers",
+    "BaseCaller": "comb_utils.lib.api_callers",
+    "BaseDeleteCaller": "comb_utils.lib.api_callers",
+    "BaseGetCaller": "comb_utils.lib.api_callers",
+    "BasePagedResponseGetter": "comb_utils.lib.api_callers",
+    "BasePostCaller": "comb_utils.lib.api_callers",
+    "concat_response_pages": "comb_utils.lib.api_callers",
+    "concat_response_pages_arrow": "comb_utils.lib.api_callers",
+    "get_response_dict": "comb_utils.lib.api_callers",
+    "get_responses": "comb_utils.lib.api_callers",
+    "iter_responses": "comb_utils.lib.api_callers",
+    "DocString": "comb_utils.lib.docs",
+    "ErrorDocString": "comb_utils.lib.docs",
+    "ConcurrencyController": "comb_utils.lib.rate_control",
+    "TokenBucket": "comb_utils.lib.rate_control",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an export from its module on first access."""
+    if name not in _EXPORT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_EXPORT_MODULES[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including exports not yet imported."""
+    return sorted({*globals(), *__all__})
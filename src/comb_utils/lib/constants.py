@@ -3,12 +3,49 @@
 from typing import Final
 
 
+class Batching:
+    """Default settings for batched POST callers in :doc:`api_callers`."""
+
+    MAX_BATCH_SIZE: Final[int] = 100
+
+
+class Caching:
+    """Default settings for caching GET responses in :doc:`api_callers`."""
+
+    MAX_SIZE: Final[int] = 128
+
+
+class Concurrency:
+    """Default settings for :py:class:`comb_utils.lib.rate_control.ConcurrencyController`."""
+
+    BREAKER_SECONDS: Final[float] = 30
+    DECREASE_SCALAR: Final[float] = 0.5
+    INCREASE: Final[float] = 0.5
+    LATENCY_WINDOW: Final[int] = 20
+    MAX_CONCURRENCY: Final[int] = 64
+    OVERLOAD_SCALAR: Final[float] = 0.5
+
+
+class ConnectionPool:
+    """Default connection pool settings for :doc:`api_callers` sessions."""
+
+    CONCURRENCY: Final[int] = 10
+    HTTP2_ENV_VAR: Final[str] = "COMB_UTILS_HTTP2"
+    KEEPALIVE_SECONDS: Final[float] = 30
+    POOL_CONNECTIONS: Final[int] = 10
+    POOL_MAXSIZE: Final[int] = 64
+
+
 class RateLimits:
     """Default rate limits for :doc:`api_callers`."""
 
+    LOW_REMAINING_FRACTION: Final[float] = 0.1
+    MAX_RETRIES: Final[int] = 10
+    MAX_WAIT_SECONDS: Final[float] = 60
     READ_TIMEOUT_SECONDS: Final[float] = 10
     READ_SECONDS: Final[float] = 0.1
     WAIT_DECREASE_SECONDS: Final[float] = 0.6
     WAIT_INCREASE_SCALAR: Final[float] = 2
+    WAIT_JITTER: Final[float] = 0.25
     WRITE_SECONDS: Final[float] = 0.2
     WRITE_TIMEOUT_SECONDS: Final[float] = 10
@@ -1,6 +1,7 @@
 """Docstring formatting for sphinx API docs and click CLI help."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Final
 
 from typeguard import typechecked
@@ -31,6 +32,9 @@ class DocString:
     """Class to format docstrings and store argument defaults for public API `sphinx` docs \
         and CLI `click` help.
 
+    The formatted docstrings are built on first access and cached. Setting an attribute
+    drops the cache, but mutating one in place (e.g., ``args["a"] = ...``) does not.
+
     Args:
             opening: The opening docstring.
             args: Argument names and their docstrings.
@@ -63,7 +67,13 @@ class DocString:
 
         return
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping the cached formatted docstrings."""
+        super().__setattr__(name, value)
+        self.__dict__.pop("api_docstring", None)
+        self.__dict__.pop("cli_docstring", None)
+
+    @cached_property
     @typechecked
     def api_docstring(self) -> str:
         """Docstring formatted for Sphinx API docs."""
@@ -85,7 +95,7 @@ class DocString:
 
         return "\n\n".join(parts) + "\n"
 
-    @property
+    @cached_property
     @typechecked
     def cli_docstring(self) -> str:
         """Docstring formatted for Click CLI help."""
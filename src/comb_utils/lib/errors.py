@@ -7,3 +7,7 @@ class CombUtilsError(Exception):
 
 class DuplicateKeysDetected(CombUtilsError):
     """Raised when a user enters a query string key twice."""
+
+
+class MaxRetriesExceeded(CombUtilsError):
+    """Raised when an API call is still being retried after the maximum number of retries."""
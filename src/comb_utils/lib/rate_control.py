@@ -0,0 +1,178 @@
+"""Controllers for pacing API calls shared across threads."""
+
+from collections import deque
+from statistics import fmean
+from threading import Condition, Lock
+from time import monotonic
+
+from typeguard import typechecked
+
+from comb_utils.lib.constants import Concurrency
+
+
+class ConcurrencyController:
+    """Limit in-flight API calls with additive-increase/multiplicative-decrease (AIMD).
+
+    Like TCP congestion control: the concurrency limit creeps up while the mean latency
+    over a sliding window of calls stays within target, and halves when it doesn't.
+    Overload responses (429s, 5xx, failed connections) cut the limit and trip a circuit
+    breaker that holds all new calls for `breaker_seconds`.
+
+    Example:
+        .. code:: python
+
+            class MyGetCaller(BaseGetCaller):
+                _concurrency_controller = ConcurrencyController(target_latency_seconds=0.5)
+
+                def _set_url(self):
+                    self._url = "https://example.com/public/v0.2b/"
+
+            # Threads calling `MyGetCaller().call_api()` now share the controller's limit.
+
+    Args:
+        target_latency_seconds: The mean latency to stay within.
+        max_concurrency: The ceiling on the concurrency limit.
+        latency_window: The number of most recent calls to average latency over.
+        increase: The amount to raise the limit by while within target latency.
+        decrease_scalar: The scalar to cut the limit by when over target latency.
+        overload_scalar: The scalar to cut the limit by on overload.
+        breaker_seconds: The time to hold new calls after an overload.
+    """
+
+    #: The current concurrency limit. (Calls in flight are capped at its floor.)
+    concurrency: float
+
+    #: The number of calls in flight.
+    _in_flight: int
+    #: The latencies of the most recent calls.
+    _latencies: deque[float]
+    #: The monotonic time the circuit breaker closes at.
+    _breaker_closes_at: float
+    #: Guards the state above, and wakes waiting calls when a slot frees up.
+    _condition: Condition
+
+    @typechecked
+    def __init__(
+        self,
+        target_latency_seconds: float,
+        max_concurrency: int = Concurrency.MAX_CONCURRENCY,
+        latency_window: int = Concurrency.LATENCY_WINDOW,
+        increase: float = Concurrency.INCREASE,
+        decrease_scalar: float = Concurrency.DECREASE_SCALAR,
+        overload_scalar: float = Concurrency.OVERLOAD_SCALAR,
+        breaker_seconds: float = Concurrency.BREAKER_SECONDS,
+    ) -> None:
+        """Initialize the controller, starting at one call in flight."""
+        self.target_latency_seconds = target_latency_seconds
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease_scalar = decrease_scalar
+        self.overload_scalar = overload_scalar
+        self.breaker_seconds = breaker_seconds
+
+        self.concurrency = 1
+        self._in_flight = 0
+        self._latencies = deque(maxlen=latency_window)
+        self._breaker_closes_at = 0
+        self._condition = Condition()
+
+    @property
+    @typechecked
+    def breaker_open(self) -> bool:
+        """Whether the circuit breaker is holding new calls."""
+        return monotonic() < self._breaker_closes_at
+
+    @typechecked
+    def acquire(self) -> None:
+        """Block until the breaker is closed and a call slot is free, then take the slot."""
+        with self._condition:
+            while True:
+                hold_seconds = self._breaker_closes_at - monotonic()
+                if hold_seconds > 0:
+                    self._condition.wait(timeout=hold_seconds)
+                elif self._in_flight >= int(self.concurrency):
+                    self._condition.wait()
+                else:
+                    break
+            self._in_flight += 1
+
+    @typechecked
+    def release(self, latency_seconds: float, overloaded: bool = False) -> None:
+        """Free the call slot and adjust the concurrency limit.
+
+        Args:
+            latency_seconds: How long the call took.
+            overloaded: Whether the API signaled overload (e.g., 429, 5xx, failed connection).
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._latencies.append(latency_seconds)
+
+            if overloaded:
+                self.concurrency = max(self.concurrency * self.overload_scalar, 1)
+                self._breaker_closes_at = monotonic() + self.breaker_seconds
+            elif fmean(self._latencies) <= self.target_latency_seconds:
+                self.concurrency = min(self.concurrency + self.increase, self.max_concurrency)
+            else:
+                self.concurrency = max(self.concurrency * self.decrease_scalar, 1)
+
+            self._condition.notify_all()
+
+
+class TokenBucket:
+    """Pace API calls shared across threads to a steady rate, absorbing bursts.
+
+    Tokens refill continuously at `rate_per_second`, up to `capacity`, and each call takes
+    one. Calls only wait when the bucket is empty, so after a quiet spell up to `capacity`
+    calls go out at once, and the sustained rate never exceeds `rate_per_second`.
+
+    Example:
+        .. code:: python
+
+            class MyGetCaller(BaseGetCaller):
+                # 600 requests per minute, in bursts of up to 20.
+                _token_bucket = TokenBucket(rate_per_second=10, capacity=20)
+
+                def _set_url(self):
+                    self._url = "https://example.com/public/v0.2b/"
+
+    Args:
+        rate_per_second: The sustained rate calls are allowed at.
+        capacity: The most calls allowed in a burst. (Defaults to a second's worth, at
+            least 1.)
+    """
+
+    #: The tokens available now. (Negative when calls have reserved future tokens.)
+    _tokens: float
+    #: The monotonic time tokens were last refilled.
+    _last_refill: float
+    #: Guards the state above.
+    _lock: Lock
+
+    @typechecked
+    def __init__(self, rate_per_second: float, capacity: float | None = None) -> None:
+        """Initialize the bucket, full."""
+        self.rate_per_second = rate_per_second
+        self.capacity = max(rate_per_second, 1) if capacity is None else capacity
+
+        self._tokens = self.capacity
+        self._last_refill = monotonic()
+        self._lock = Lock()
+
+    @typechecked
+    def reserve(self) -> float:
+        """Take a token, reserving a future one if the bucket is empty.
+
+        Returns:
+            The seconds to wait before making the call. (0 if a token was available.)
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self._tokens + (now - self._last_refill) * self.rate_per_second,
+                self.capacity,
+            )
+            self._last_refill = now
+            self._tokens -= 1
+
+            return max(-self._tokens / self.rate_per_second, 0)
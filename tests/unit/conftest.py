@@ -4,7 +4,8 @@ from collections.abc import Iterator
 from unittest.mock import patch
 
 import pytest
-from typeguard import typechecked
+
+from tests.unit.utils import typechecked
 
 
 @pytest.fixture(autouse=True)
@@ -1,23 +1,47 @@
 """A test suite for the API callers module."""
 
-from contextlib import AbstractContextManager, nullcontext
-from typing import Any, Final, Literal, get_args
+import json
+import re
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from contextlib import AbstractContextManager, nullcontext, suppress
+from functools import cache
+from http.client import HTTPMessage
+from pathlib import Path
+from threading import Barrier, BrokenBarrierError, Thread
+from types import SimpleNamespace
+from typing import Any, Final, Literal, cast, get_args
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
-from typeguard import typechecked
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from requests.structures import CaseInsensitiveDict
 
 from comb_utils import (
+    BaseBatchedPostCaller,
     BaseCaller,
     BaseDeleteCaller,
     BaseGetCaller,
     BasePagedResponseGetter,
     BasePostCaller,
+    ConcurrencyController,
+    TokenBucket,
+    concat_response_pages,
+    concat_response_pages_arrow,
+    get_response_dict,
     get_responses,
+    iter_responses,
 )
-from comb_utils.lib import errors
-from comb_utils.lib.constants import RateLimits
+from comb_utils.lib import api_callers, errors, rate_control
+from comb_utils.lib.constants import ConnectionPool, RateLimits
+from tests.unit.utils import typechecked
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
 
 BASE_URL: Final[str] = "https://example.com/api/test"
 
@@ -26,343 +50,1231 @@ RequestType = Literal["get", "post", "delete"]
 REQUEST_TYPES: Final = get_args(RequestType)
 
 
+class _FakeResponse(requests.Response):
+    """A real response with canned JSON content, much cheaper to build than a `Mock`.
+
+    `raise_for_status` raises the given error, if any, whatever the status code.
+    """
+
+    #: Whether the content was read, set but not declared by `requests.Response`.
+    _content_consumed: bool
+
+    def __init__(
+        self,
+        status_code: int,
+        json_value: Any,
+        error: type[Exception] | Exception | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__()
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._content = json.dumps(json_value).encode()
+        self._error = error
+
+    def raise_for_status(self) -> None:
+        """Raise the given error, if any."""
+        if self._error is not None:
+            raise self._error
+
+
 @typechecked
-def _caller_factory(request_type: RequestType) -> BaseCaller:
-    mock_caller: BaseCaller
+def _fake_response(**attributes: Any) -> _FakeResponse:
+    """Make a fake response from `Mock`-style attributes.
 
-    # Repeated class definition to avoid mypy errors about abstract classes.
-    if request_type == "get":
+    Accepts `status_code`, `headers`, `json.return_value` (defaults to empty), and
+    `raise_for_status.side_effect`.
+    """
+    return _FakeResponse(
+        status_code=attributes["status_code"],
+        json_value=attributes.get("json.return_value", {}),
+        error=attributes.get("raise_for_status.side_effect"),
+        headers=attributes.get("headers"),
+    )
 
-        class GetCaller(BaseGetCaller):
-            def _set_url(self) -> None:
-                self._url = BASE_URL
 
-        mock_caller = GetCaller()
+#: Response attributes shared across parametrize tables.
+_OK_RESPONSE: Final[dict[str, Any]] = {"status_code": 200}
+_NO_CONTENT_RESPONSE: Final[dict[str, Any]] = {"status_code": 204}
+_RATE_LIMITED_RESPONSE: Final[dict[str, Any]] = {
+    "json.return_value": {},
+    "status_code": 429,
+    "raise_for_status.side_effect": requests.exceptions.HTTPError,
+}
+_TIMED_OUT_RESPONSE: Final[dict[str, Any]] = {
+    "json.return_value": {},
+    "status_code": 598,
+    "raise_for_status.side_effect": requests.exceptions.Timeout,
+}
+_BAD_REQUEST_RESPONSE: Final[dict[str, Any]] = {
+    "status_code": 400,
+    "raise_for_status.side_effect": requests.exceptions.HTTPError,
+}
+#: The error message expected for `_BAD_REQUEST_RESPONSE`, compiled once.
+_BAD_REQUEST_MESSAGE: Final[re.Pattern] = re.compile("Got 400 response")
 
-    elif request_type == "post":
 
-        class PostCaller(BasePostCaller):
-            def _set_url(self) -> None:
-                self._url = BASE_URL
+class _RetryCounter(BaseCaller):
+    """Counts the retry handler calls of a test caller, to assert on without spies."""
 
-        mock_caller = PostCaller()
+    #: How many times `_handle_429` was called on the object.
+    n_429_calls: int = 0
+    #: How many times `_handle_timeout` was called on the object.
+    n_timeout_calls: int = 0
 
-    elif request_type == "delete":
+    def _handle_429(self) -> None:
+        self.n_429_calls += 1
+        super()._handle_429()
 
-        class DeleteCaller(BaseDeleteCaller):
-            def _set_url(self) -> None:
-                self._url = BASE_URL
+    def _handle_timeout(self) -> None:
+        self.n_timeout_calls += 1
+        super()._handle_timeout()
 
-        mock_caller = DeleteCaller()
 
-    return mock_caller
+class GetCaller(_RetryCounter, BaseGetCaller):
+    """A GET caller for tests."""
 
+    def _set_url(self) -> None:
+        self._url = BASE_URL
 
-@pytest.mark.parametrize(
-    "request_type",
-    REQUEST_TYPES,
-)
+
+class PostCaller(_RetryCounter, BasePostCaller):
+    """A POST caller for tests."""
+
+    def _set_url(self) -> None:
+        self._url = BASE_URL
+
+
+class DeleteCaller(_RetryCounter, BaseDeleteCaller):
+    """A DELETE caller for tests."""
+
+    def _set_url(self) -> None:
+        self._url = BASE_URL
+
+
+#: The test caller class for each request type, defined once rather than per test.
+_CALLER_CLASSES: Final[dict[str, type[_RetryCounter]]] = {
+    "get": GetCaller,
+    "post": PostCaller,
+    "delete": DeleteCaller,
+}
+
+#: The request types paired with their test caller classes, to parametrize tests over.
+_REQUEST_CALLERS: Final = tuple(_CALLER_CLASSES.items())
+
+
+@cache
+def _defined_names(caller_cls: type[BaseCaller]) -> frozenset[str]:
+    """The attributes a class defines itself, taken before any test sets more on it."""
+    return frozenset(vars(caller_cls))
+
+
+@pytest.fixture(autouse=True)
 @typechecked
-def test_key_call(request_type: RequestType) -> None:
+def reset_caller_classes() -> Iterator[None]:
+    """Reset the caller classes to their defaults after each test, closing their sessions.
+
+    Covers the test caller classes and `BasePagedResponseGetter`, which tests use directly.
+    Class state set during a test (e.g., adjusted `_wait_seconds` and `_timeout`, a token
+    bucket or concurrency controller, the session and response cache) is dropped rather than
+    restored, so the next test starts from the class defaults with fresh objects.
+    """
+    caller_classes: tuple[type[BaseCaller], ...] = (
+        *_CALLER_CLASSES.values(),
+        _CachedGetCaller,
+        _BatchCaller,
+        BasePagedResponseGetter,
+    )
+    defined_names = {caller_cls: _defined_names(caller_cls) for caller_cls in caller_classes}
+    yield
+
+    for caller_cls, names in defined_names.items():
+        caller_cls.close()
+        for name in set(vars(caller_cls)) - names:
+            delattr(caller_cls, name)
+
+
+@pytest.fixture
+@typechecked
+def patched_verb(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> tuple[Mock, type[_RetryCounter]]:
+    """Patch the session method of the request type passed indirectly.
+
+    Sets the mock with `monkeypatch`, which undoes it after the test, rather than entering a
+    `patch` context.
+
+    Returns:
+        The session method mock, and the test caller class for the request type.
+    """
+    mock_request = Mock()
+    monkeypatch.setattr(requests.Session, request.param, mock_request)
+
+    return mock_request, _CALLER_CLASSES[request.param]
+
+
+@pytest.mark.parametrize("patched_verb", REQUEST_TYPES, indirect=True)
+@typechecked
+def test_key_call(patched_verb: tuple[Mock, type[_RetryCounter]]) -> None:
     """Test `call_api` calls `_get_API_key`."""
+    mock_request, caller_cls = patched_verb
     response_sequence: list[dict[str, Any]] = [
         {"json.return_value": {"data": [1, 2, 3]}, "status_code": 200}
     ]
+    mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+
+    with patch.object(BaseCaller, "_get_API_key", return_value="") as mock_get_API_key:
+        mock_caller = caller_cls()
+        mock_caller.call_api()
+
+    assert mock_get_API_key.call_count == 1
 
-    with patch(f"requests.{request_type}") as mock_request:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
-        mock_caller = _caller_factory(request_type)
+
+@pytest.mark.parametrize(
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@typechecked
+def test_auth_header(request_type: RequestType, caller_cls: type[BaseCaller]) -> None:
+    """Test the basic auth is built once per object, and rebuilt after a 401."""
+    response_sequence: list[dict[str, Any]] = [
+        {"json.return_value": {}, "status_code": 200},
+        {"json.return_value": {}, "status_code": 200},
+        {"status_code": 401, "raise_for_status.side_effect": requests.exceptions.HTTPError},
+        {"json.return_value": {}, "status_code": 200},
+    ]
+
+    with patch.object(requests.Session, request_type) as mock_request:
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+        mock_caller = caller_cls()
 
         with patch.object(
-            mock_caller, "_get_API_key", wraps=mock_caller._get_API_key
-        ) as spy_handle_get_API_key:
+            mock_caller, "_get_API_key", return_value="my_key"
+        ) as mock_get_API_key:
+            mock_caller.call_api()
+            mock_caller.call_api()
+            assert mock_get_API_key.call_count == 1
+
+            with pytest.raises(requests.exceptions.HTTPError, match="Got 401 response"):
+                mock_caller.call_api()
             mock_caller.call_api()
-            spy_handle_get_API_key.assert_called_once()
+            assert mock_get_API_key.call_count == 2
+
+    for call in mock_request.call_args_list:
+        assert call.kwargs["auth"] == HTTPBasicAuth(username="my_key", password="")
+
+
+@pytest.mark.parametrize("caller_cls", _CALLER_CLASSES.values())
+@typechecked
+def test_session_reuse(caller_cls: type[BaseCaller]) -> None:
+    """Test instances of a class share one pooled session until closed."""
+    first_caller = caller_cls()
+    second_caller = caller_cls()
+
+    session = first_caller._get_session()
+    assert second_caller._get_session() is session
+    assert isinstance(session, requests.Session)
+    adapter = cast(HTTPAdapter, session.get_adapter(BASE_URL))
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == ConnectionPool.POOL_MAXSIZE
+
+    with patch.object(session, "close", wraps=session.close) as spy_close:
+        caller_cls.close()
+        spy_close.assert_called_once()
+
+    assert caller_cls._get_session() is not session
+    caller_cls.close()
+
+
+@typechecked
+def test_state_lock_threads() -> None:
+    """Test each class has its own state lock, which keeps adjustments from interleaving."""
+    barrier = Barrier(2, timeout=0.1)
+
+    class FirstCaller(BaseGetCaller):
+        _max_wait_seconds = float("inf")
+
+        @property
+        def _wait_increase_scalar(self) -> float:  # type: ignore[override]
+            # Holds each increase between reading and writing the wait time until the other
+            # thread's increase gets here too, which only happens if nothing locks it out.
+            with suppress(BrokenBarrierError):
+                barrier.wait()
+
+            return 2
+
+        def _set_url(self) -> None:
+            self._url = BASE_URL
+
+    class SecondCaller(FirstCaller):
+        pass
+
+    assert FirstCaller._state_lock is not BaseGetCaller._state_lock
+    assert SecondCaller._state_lock is not FirstCaller._state_lock
+
+    FirstCaller._wait_seconds = 1
+    threads = [Thread(target=FirstCaller()._increase_wait_time) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Unlocked, both threads read 1 and write 2.
+    assert FirstCaller._wait_seconds == 4
 
 
 @pytest.mark.parametrize(
-    "request_type",
-    REQUEST_TYPES,
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
 )
+@pytest.mark.parametrize(
+    "status_code, expected_result, error_context",
+    [
+        (200, {"data": [1, 2, 3]}, None),
+        (
+            404,
+            None,
+            pytest.raises(requests.exceptions.HTTPError, match="Got 404 response"),
+        ),
+    ],
+)
+@typechecked
+def test_http2_session(
+    request_type: RequestType,
+    caller_cls: type[BaseCaller],
+    status_code: int,
+    expected_result: dict[str, Any] | None,
+    error_context: AbstractContextManager | None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the HTTP/2 httpx session handles responses like the requests session."""
+    pytest.importorskip("httpx")
+    monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+
+    response = httpx.Response(
+        status_code,
+        json={"data": [1, 2, 3]},
+        request=httpx.Request(request_type.upper(), BASE_URL),
+    )
+    with patch.object(httpx.Client, "request", return_value=response) as mock_request:
+        mock_caller = caller_cls()
+        session = mock_caller._get_session()
+        assert isinstance(session, httpx.Client)
+        assert cast(httpx.HTTPTransport, session._transport)._pool._http2
+
+        with error_context or nullcontext():
+            mock_caller.call_api()
+            assert mock_caller.response_json == expected_result
+
+    assert mock_request.call_args.args == (request_type.upper(),)
+    assert mock_request.call_args.kwargs["headers"]["Authorization"] == "Basic Og=="
+    caller_cls.close()
+
+
+@pytest.mark.parametrize(
+    "call_kwargs, expected_kwargs, error_context",
+    [
+        ({"json": {"a": 1}}, {"json": {"a": 1}}, None),
+        ({"data": {"a": "1"}}, {"data": {"a": "1"}}, None),
+        ({"data": b"raw"}, {"content": b"raw"}, None),
+        ({"data": "raw"}, {"content": "raw"}, None),
+        ({"allow_redirects": False}, {"follow_redirects": False}, None),
+        (
+            {"verify": False, "stream": True},
+            None,
+            pytest.raises(TypeError, match=r"doesn't take \['stream', 'verify'\]"),
+        ),
+    ],
+    ids=["json", "form_data", "bytes_data", "str_data", "allow_redirects", "client_only"],
+)
+@pytest.mark.parametrize("request_type, caller_cls", _REQUEST_CALLERS)
+@typechecked
+def test_httpx_call_kwargs(
+    request_type: RequestType,
+    caller_cls: type[BaseCaller],
+    call_kwargs: dict[str, Any],
+    expected_kwargs: dict[str, Any] | None,
+    error_context: AbstractContextManager | None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the httpx session takes requests call kwargs for every method, or rejects them."""
+    pytest.importorskip("httpx")
+    monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+
+    response = httpx.Response(
+        200, json={}, request=httpx.Request(request_type.upper(), BASE_URL)
+    )
+    with patch.object(httpx.Client, "request", return_value=response) as mock_request:
+        mock_caller = caller_cls()
+        mock_caller._call_kwargs = call_kwargs
+
+        with error_context or nullcontext():
+            mock_caller.call_api()
+
+    if expected_kwargs is None:
+        mock_request.assert_not_called()
+    else:
+        sent_kwargs = mock_request.call_args.kwargs
+        assert {key: sent_kwargs[key] for key in expected_kwargs} == expected_kwargs
+        renamed_kwargs = set(call_kwargs) - set(expected_kwargs)
+        assert not renamed_kwargs & set(sent_kwargs)
+    caller_cls.close()
+
+
+#: Where the redirect test transports redirect `BASE_URL` to.
+_REDIRECTED_URL: Final[str] = f"{BASE_URL}/redirected"
+
+
+class _RedirectAdapter(HTTPAdapter):
+    """Redirects `BASE_URL` to `_REDIRECTED_URL`, which responds with JSON."""
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        if request.url == BASE_URL:
+            response = _FakeResponse(
+                status_code=302, json_value={}, headers={"Location": _REDIRECTED_URL}
+            )
+        else:
+            response = _FakeResponse(status_code=200, json_value={"data": [1, 2, 3]})
+        response.request = request
+        response.url = str(request.url)
+        response._content_consumed = True
+
+        return response
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+@pytest.mark.parametrize("caller_cls", [GetCaller, PostCaller, DeleteCaller])
+@typechecked
+def test_session_follows_redirects(
+    http2: bool, caller_cls: type[BaseCaller], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test both session backends follow redirects to the final response."""
+    if http2:
+        pytest.importorskip("httpx")
+        monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+
+    session = caller_cls._get_session()
+    if http2:
+
+        def _redirect(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == BASE_URL:
+                return httpx.Response(302, headers={"Location": _REDIRECTED_URL})
+
+            return httpx.Response(200, json={"data": [1, 2, 3]})
+
+        assert isinstance(session, httpx.Client)
+        monkeypatch.setattr(session, "_transport", httpx.MockTransport(_redirect))
+    else:
+        assert isinstance(session, requests.Session)
+        session.mount("https://", _RedirectAdapter())
+
+    mock_caller = caller_cls()
+    mock_caller.call_api()
+
+    assert mock_caller.response_json == {"data": [1, 2, 3]}
+    caller_cls.close()
+
+
+@typechecked
+def _patch_transport(
+    monkeypatch: pytest.MonkeyPatch, http2: bool
+) -> list[CaseInsensitiveDict[str]]:
+    """Respond to every request with a `Set-Cookie`, for the requests or httpx backend.
+
+    Patches the backend's transport, under the session, so real sessions handle responses.
+
+    Returns:
+        The headers sent with each request, filled as requests are sent.
+    """
+    sent_headers: list[CaseInsensitiveDict[str]] = []
+    if http2:
+        pytest.importorskip("httpx")
+        monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+
+        def _handle_request(self: Any, request: httpx.Request) -> httpx.Response:
+            sent_headers.append(CaseInsensitiveDict(request.headers))
+            return httpx.Response(200, json={}, headers={"Set-Cookie": "session=abc; Path=/"})
+
+        monkeypatch.setattr(httpx.HTTPTransport, "handle_request", _handle_request)
+    else:
+
+        def _send(
+            self: Any, request: requests.PreparedRequest, **kwargs: Any
+        ) -> requests.Response:
+            sent_headers.append(CaseInsensitiveDict(request.headers))
+            message = HTTPMessage()
+            message["Set-Cookie"] = "session=abc; Path=/"
+            response = _FakeResponse(status_code=200, json_value={})
+            response.raw = SimpleNamespace(_original_response=SimpleNamespace(msg=message))
+            response.request = request
+            response.url = str(request.url)
+            response._content_consumed = True
+
+            return response
+
+        monkeypatch.setattr(HTTPAdapter, "send", _send)
+
+    return sent_headers
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+@pytest.mark.parametrize("caller_cls", [GetCaller, PostCaller, DeleteCaller])
+@typechecked
+def test_session_rejects_cookies(
+    http2: bool, caller_cls: type[BaseCaller], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the class session doesn't send one call's `Set-Cookie` on later calls."""
+    sent_headers = _patch_transport(monkeypatch=monkeypatch, http2=http2)
+
+    caller_cls().call_api()
+    caller_cls().call_api()
+
+    assert [headers.get("Cookie") for headers in sent_headers] == [None, None]
+    assert len(caller_cls._get_session().cookies) == 0
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+@pytest.mark.parametrize("caller_cls", [GetCaller, PostCaller, DeleteCaller])
+@typechecked
+def test_session_after_close(
+    http2: bool, caller_cls: type[BaseCaller], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test objects made before `close` call with the class's new session."""
+    sent_headers = _patch_transport(monkeypatch=monkeypatch, http2=http2)
+    mock_caller = caller_cls()
+    mock_caller.call_api()
+    closed_session = caller_cls._get_session()
+
+    caller_cls.close()
+    mock_caller.call_api()
+
+    assert len(sent_headers) == 2
+    assert caller_cls._get_session() is not closed_session
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+@pytest.mark.parametrize("caller_cls", [GetCaller, PostCaller, DeleteCaller])
+@typechecked
+def test_auth_over_netrc(
+    http2: bool,
+    caller_cls: type[BaseCaller],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test the API key is sent, not a `~/.netrc` entry for the host."""
+    netrc_path = tmp_path / ".netrc"
+    netrc_path.write_text("machine example.com login netrcuser password netrcpw\n")
+    netrc_path.chmod(0o600)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("NETRC", raising=False)
+    monkeypatch.setattr(caller_cls, "_get_API_key", lambda self: "my_key")
+    sent_headers = _patch_transport(monkeypatch=monkeypatch, http2=http2)
+
+    caller_cls().call_api()
+
+    assert [headers["Authorization"] for headers in sent_headers] == ["Basic bXlfa2V5Og=="]
+
+
+@pytest.mark.parametrize("http2", [False, True], ids=["requests", "httpx"])
+@pytest.mark.parametrize("request_type, caller_cls", _REQUEST_CALLERS)
+@typechecked
+def test_send_timeout_retries(
+    http2: bool,
+    request_type: RequestType,
+    caller_cls: type[_RetryCounter],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test requests that time out before responding are retried on both backends."""
+    session_cls: type = requests.Session
+    timeout_error: Exception = requests.exceptions.ReadTimeout("Timed out.")
+    if http2:
+        pytest.importorskip("httpx")
+        monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+        session_cls = httpx.Client
+        timeout_error = httpx.ReadTimeout("Timed out.")
+
+    timeout = caller_cls._timeout
+    with patch.object(session_cls, "request" if http2 else request_type) as mock_request:
+        mock_request.side_effect = [timeout_error, _fake_response(**_OK_RESPONSE)]
+        mock_caller = caller_cls()
+        mock_caller.call_api()
+
+    assert mock_caller.n_timeout_calls == 1
+    assert mock_caller.response_json == {}
+    assert caller_cls._timeout == pytest.approx(timeout * RateLimits.WAIT_INCREASE_SCALAR)
+    caller_cls.close()
+
+
+@pytest.mark.parametrize("request_type, caller_cls", _REQUEST_CALLERS)
+@typechecked
+def test_httpx_connect_error(
+    request_type: RequestType, caller_cls: type[BaseCaller], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test httpx connection errors are raised as `requests` connection errors."""
+    pytest.importorskip("httpx")
+    monkeypatch.setenv(ConnectionPool.HTTP2_ENV_VAR, "1")
+
+    with patch.object(
+        httpx.Client, "request", side_effect=httpx.ConnectError("Refused.")
+    ), pytest.raises(requests.exceptions.ConnectionError, match="Refused."):
+        caller_cls().call_api()
+
+    caller_cls.close()
+
+
+@pytest.mark.parametrize("patched_verb", REQUEST_TYPES, indirect=True)
 @pytest.mark.parametrize(
     "response_sequence, expected_result, error_context",
     [
         (
             [{"json.return_value": {"data": [1, 2, 3]}, "status_code": 200}],
             {"data": [1, 2, 3]},
-            nullcontext(),
+            None,
         ),
-        ([{"json.return_value": {}, "status_code": 204}], {}, nullcontext()),
+        ([{"json.return_value": {}, "status_code": 204}], {}, None),
         (
             [
-                {
-                    "json.return_value": {},
-                    "status_code": 429,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
+                _RATE_LIMITED_RESPONSE,
                 {"json.return_value": {"data": [5, 6]}, "status_code": 200},
             ],
             {"data": [5, 6]},
-            nullcontext(),
+            None,
         ),
         (
             [
-                {
-                    "json.return_value": {},
-                    "status_code": 598,
-                    "raise_for_status.side_effect": requests.exceptions.Timeout,
-                },
+                _TIMED_OUT_RESPONSE,
                 {"json.return_value": {"data": [7, 8]}, "status_code": 200},
             ],
             {"data": [7, 8]},
-            nullcontext(),
+            None,
         ),
         (
-            [
-                {
-                    "status_code": 400,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                }
-            ],
+            [_BAD_REQUEST_RESPONSE],
             None,
-            pytest.raises(requests.exceptions.HTTPError, match="Got 400 response"),
+            pytest.raises(requests.exceptions.HTTPError, match=_BAD_REQUEST_MESSAGE),
         ),
         (
             [
-                {
-                    "json.return_value": {},
-                    "status_code": 429,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
-                {
-                    "status_code": 400,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
+                _RATE_LIMITED_RESPONSE,
+                _BAD_REQUEST_RESPONSE,
             ],
             None,
-            pytest.raises(requests.exceptions.HTTPError, match="Got 400 response"),
+            pytest.raises(requests.exceptions.HTTPError, match=_BAD_REQUEST_MESSAGE),
         ),
         (
             [
-                {
-                    "json.return_value": {},
-                    "status_code": 598,
-                    "raise_for_status.side_effect": requests.exceptions.Timeout,
-                },
-                {
-                    "status_code": 400,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
+                _TIMED_OUT_RESPONSE,
+                _BAD_REQUEST_RESPONSE,
             ],
             None,
-            pytest.raises(requests.exceptions.HTTPError, match="Got 400 response"),
+            pytest.raises(requests.exceptions.HTTPError, match=_BAD_REQUEST_MESSAGE),
+        ),
+        (
+            [_RATE_LIMITED_RESPONSE] * (RateLimits.MAX_RETRIES + 1),
+            None,
+            pytest.raises(errors.MaxRetriesExceeded),
         ),
     ],
+    ids=[
+        "200",
+        "204",
+        "429_then_200",
+        "598_then_200",
+        "400",
+        "429_then_400",
+        "598_then_400",
+        "429_max_retries",
+    ],
 )
 @typechecked
 def test_base_caller_response_handling(
-    request_type: RequestType,
+    patched_verb: tuple[Mock, type[_RetryCounter]],
     response_sequence: list[dict[str, Any]],
     expected_result: dict[str, Any] | None,
-    error_context: AbstractContextManager,
+    error_context: AbstractContextManager | None,
 ) -> None:
     """Test `call_api` handling of different HTTP responses, including retries."""
-    with patch(f"requests.{request_type}") as mock_request:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
-        mock_caller = _caller_factory(request_type)
+    mock_request, caller_cls = patched_verb
+    mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+    mock_caller = caller_cls()
 
-        with patch.object(
-            mock_caller, "_handle_429", wraps=mock_caller._handle_429
-        ) as spy_handle_429, patch.object(
-            mock_caller, "_handle_timeout", wraps=mock_caller._handle_timeout
-        ) as spy_handle_timeout:
-
-            with error_context:
-                mock_caller.call_api()
+    with error_context or nullcontext():
+        mock_caller.call_api()
 
-                assert mock_caller.response_json == expected_result
+        assert mock_caller.response_json == expected_result
 
-                if any(resp["status_code"] == 429 for resp in response_sequence):
-                    spy_handle_429.assert_called_once()
+        if any(resp["status_code"] == 429 for resp in response_sequence):
+            assert mock_caller.n_429_calls == 1
 
-                if any(resp["status_code"] == 598 for resp in response_sequence):
-                    spy_handle_timeout.assert_called_once()
+        if any(resp["status_code"] == 598 for resp in response_sequence):
+            assert mock_caller.n_timeout_calls == 1
 
-                assert mock_request.call_count == len(response_sequence)
+        assert mock_request.call_count == len(response_sequence)
 
 
+@pytest.mark.parametrize("patched_verb", REQUEST_TYPES, indirect=True)
 @pytest.mark.parametrize(
-    "request_type, response_sequence, expected_wait_time",
+    "response_sequence, wait_time_scalar, timeout_scalar",
     [
+        ([_OK_RESPONSE], 1, 1),
+        ([_NO_CONTENT_RESPONSE], 1, 1),
         (
-            "get",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.READ_SECONDS,
-        ),
-        (
-            "post",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_SECONDS,
-        ),
-        (
-            "delete",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_SECONDS,
-        ),
-        (
-            "get",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.READ_SECONDS,
-        ),
-        (
-            "post",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_SECONDS,
-        ),
-        (
-            "delete",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_SECONDS,
-        ),
-        (
-            "get",
             [
-                {
-                    "status_code": 429,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
-                {"status_code": 200, "raise_for_status.side_effect": None},
-            ],
-            RateLimits.READ_SECONDS
-            * RateLimits.WAIT_INCREASE_SCALAR
-            * RateLimits.WAIT_DECREASE_SECONDS,
-        ),
-        (
-            "post",
-            [
-                {
-                    "status_code": 429,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
-                {"status_code": 200, "raise_for_status.side_effect": None},
+                _RATE_LIMITED_RESPONSE,
+                _OK_RESPONSE,
             ],
-            RateLimits.WRITE_SECONDS
-            * RateLimits.WAIT_INCREASE_SCALAR
-            * RateLimits.WAIT_DECREASE_SECONDS,
+            RateLimits.WAIT_INCREASE_SCALAR * RateLimits.WAIT_DECREASE_SECONDS,
+            1,
         ),
         (
-            "delete",
             [
-                {
-                    "status_code": 429,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
-                },
-                {"status_code": 200, "raise_for_status.side_effect": None},
+                _TIMED_OUT_RESPONSE,
+                _OK_RESPONSE,
             ],
-            RateLimits.WRITE_SECONDS
-            * RateLimits.WAIT_INCREASE_SCALAR
-            * RateLimits.WAIT_DECREASE_SECONDS,
+            1,
+            RateLimits.WAIT_INCREASE_SCALAR,
         ),
     ],
+    ids=["200", "204", "429_then_200", "598_then_200"],
 )
 @typechecked
-def test_base_caller_wait_time_adjusting(
-    request_type: RequestType,
+def test_base_caller_rate_adjusting(
+    patched_verb: tuple[Mock, type[_RetryCounter]],
     response_sequence: list[dict[str, Any]],
-    expected_wait_time: float,
+    wait_time_scalar: float,
+    timeout_scalar: float,
+) -> None:
+    """Test wait time adjustments on rate-limiting, and timeout adjustments on timeouts."""
+    mock_request, caller_cls = patched_verb
+    mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+
+    caller_cls().call_api()
+
+    if issubclass(caller_cls, BaseGetCaller):
+        wait_seconds, timeout = RateLimits.READ_SECONDS, RateLimits.READ_TIMEOUT_SECONDS
+    else:
+        wait_seconds, timeout = RateLimits.WRITE_SECONDS, RateLimits.WRITE_TIMEOUT_SECONDS
+    assert caller_cls._wait_seconds == pytest.approx(wait_seconds * wait_time_scalar)
+    assert caller_cls._timeout == pytest.approx(timeout * timeout_scalar)
+
+
+@pytest.mark.parametrize(
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@typechecked
+def test_base_caller_retry_backoff(
+    request_type: RequestType, caller_cls: type[BaseCaller]
 ) -> None:
-    """Test request wait time adjustments on rate-limiting."""
-    with patch(f"requests.{request_type}") as mock_request:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
+    """Test retries sleep a jittered, capped, doubling wait time."""
+    n_retries = 4
+    response_sequence: list[dict[str, Any]] = [_RATE_LIMITED_RESPONSE] * n_retries + [
+        _NO_CONTENT_RESPONSE
+    ]
+
+    with patch.object(requests.Session, request_type) as mock_request, patch.object(
+        api_callers, "sleep"
+    ) as mock_sleep:
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+        mock_caller = caller_cls()
+        initial_wait_seconds = caller_cls._wait_seconds
+        caller_cls._max_wait_seconds = (
+            initial_wait_seconds * RateLimits.WAIT_INCREASE_SCALAR**2
+        )
 
-        mock_caller = _caller_factory(request_type)
         mock_caller.call_api()
 
-        assert mock_caller.__class__._wait_seconds == expected_wait_time
+    sleeps = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(sleeps) == n_retries + 1
+    assert sleeps[0] == initial_wait_seconds
+    for attempt, wait_seconds in enumerate(sleeps[1:], start=1):
+        expected_wait_seconds = min(
+            initial_wait_seconds * RateLimits.WAIT_INCREASE_SCALAR**attempt,
+            caller_cls._max_wait_seconds,
+        )
+        assert (
+            expected_wait_seconds
+            <= wait_seconds
+            <= expected_wait_seconds * (1 + RateLimits.WAIT_JITTER)
+        )
+
+
+@pytest.mark.parametrize(
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@typechecked
+def test_base_caller_token_bucket(
+    request_type: RequestType, caller_cls: type[BaseCaller]
+) -> None:
+    """Test a token bucket paces calls in place of the minimum wait time."""
+    response_sequence: list[dict[str, Any]] = [_NO_CONTENT_RESPONSE] * 4
+
+    with patch.object(requests.Session, request_type) as mock_request, patch.object(
+        api_callers, "sleep"
+    ) as mock_sleep, patch.object(rate_control, "monotonic", return_value=0):
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+        mock_caller = caller_cls()
+        caller_cls._token_bucket = TokenBucket(rate_per_second=2, capacity=2)
+
+        for _ in response_sequence:
+            mock_caller.call_api()
+
+    sleeps = [call.args[0] for call in mock_sleep.call_args_list]
+    assert sleeps == pytest.approx([0, 0, 0.5, 1])
 
 
 @pytest.mark.parametrize(
-    "request_type, response_sequence, expected_timeout",
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@pytest.mark.parametrize(
+    "retry_after, expected_wait_time",
     [
+        ("3", 3 * RateLimits.WAIT_DECREASE_SECONDS),
+        ("0", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", None),
+        ("Wed, 21 Oct 2015 07:28:00 -0000", None),
+        ("Sun Nov  6 08:49:37 1994", None),
+        ("soon", None),
+        ("100000", RateLimits.MAX_WAIT_SECONDS * RateLimits.WAIT_DECREASE_SECONDS),
         (
-            "get",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.READ_TIMEOUT_SECONDS,
-        ),
-        (
-            "post",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_TIMEOUT_SECONDS,
-        ),
-        (
-            "delete",
-            [{"status_code": 200, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_TIMEOUT_SECONDS,
-        ),
-        (
-            "get",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.READ_TIMEOUT_SECONDS,
-        ),
-        (
-            "post",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_TIMEOUT_SECONDS,
-        ),
-        (
-            "delete",
-            [{"status_code": 204, "raise_for_status.side_effect": None}],
-            RateLimits.WRITE_TIMEOUT_SECONDS,
-        ),
-        (
-            "get",
-            [
-                {
-                    "status_code": 598,
-                    "raise_for_status.side_effect": requests.exceptions.Timeout,
-                },
-                {"status_code": 200, "raise_for_status.side_effect": None},
-            ],
-            RateLimits.READ_TIMEOUT_SECONDS * RateLimits.WAIT_INCREASE_SCALAR,
-        ),
-        (
-            "post",
-            [
-                {
-                    "status_code": 598,
-                    "raise_for_status.side_effect": requests.exceptions.Timeout,
-                },
-                {"status_code": 200, "raise_for_status.side_effect": None},
-            ],
-            RateLimits.WRITE_TIMEOUT_SECONDS * RateLimits.WAIT_INCREASE_SCALAR,
+            "Fri, 31 Dec 9999 23:59:59 GMT",
+            RateLimits.MAX_WAIT_SECONDS * RateLimits.WAIT_DECREASE_SECONDS,
         ),
+    ],
+    ids=[
+        "seconds",
+        "zero_seconds",
+        "past_date",
+        "past_date_no_zone",
+        "past_asctime_date",
+        "malformed",
+        "seconds_over_cap",
+        "date_over_cap",
+    ],
+)
+@typechecked
+def test_base_caller_retry_after(
+    request_type: RequestType,
+    caller_cls: type[BaseCaller],
+    retry_after: str,
+    expected_wait_time: float | None,
+) -> None:
+    """Test a 429's `Retry-After` sets the wait time, within the min and max wait times."""
+    response_sequence: list[dict[str, Any]] = [
+        {
+            "status_code": 429,
+            "headers": {"Retry-After": retry_after},
+            "raise_for_status.side_effect": requests.exceptions.HTTPError,
+        },
+        {"status_code": 204, "headers": {}, "raise_for_status.side_effect": None},
+    ]
+
+    with patch.object(requests.Session, request_type) as mock_request:
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+        mock_caller = caller_cls()
+        min_wait_seconds = mock_caller._min_wait_seconds
+        mock_caller.call_api()
+
+    if retry_after == "soon":
+        # Malformed, so falls back to increasing the wait time.
+        expected_wait_time = (
+            min_wait_seconds
+            * RateLimits.WAIT_INCREASE_SCALAR
+            * RateLimits.WAIT_DECREASE_SECONDS
+        )
+    elif expected_wait_time is None:
+        # In the past, so floored at the minimum.
+        expected_wait_time = min_wait_seconds
+
+    assert caller_cls._wait_seconds == pytest.approx(expected_wait_time)
+
+
+@pytest.mark.parametrize(
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@pytest.mark.parametrize(
+    "remaining, reset_in_seconds, expected_wait_time",
+    [
+        ("50", 10, None),
+        ("5", 10, 2),
+        ("0", 10, 10),
+        ("0", 1000, RateLimits.MAX_WAIT_SECONDS),
+    ],
+)
+@typechecked
+def test_base_caller_rate_headers(
+    request_type: RequestType,
+    caller_cls: type[BaseCaller],
+    remaining: str,
+    reset_in_seconds: float,
+    expected_wait_time: float | None,
+) -> None:
+    """Test the wait time is raised to pace the remaining calls when nearly rate limited."""
+    with patch.object(requests.Session, request_type) as mock_request, patch.object(
+        api_callers, "time", return_value=1000
+    ):
+        mock_request.return_value = Mock(
+            status_code=204,
+            headers={
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": remaining,
+                "X-RateLimit-Reset": str(1000 + reset_in_seconds),
+            },
+        )
+        mock_caller = caller_cls()
+        min_wait_seconds = mock_caller._min_wait_seconds
+        mock_caller.call_api()
+
+    expected_wait_time = expected_wait_time or min_wait_seconds
+    assert caller_cls._wait_seconds == pytest.approx(expected_wait_time)
+
+
+@pytest.mark.parametrize(
+    "request_type, caller_cls",
+    _REQUEST_CALLERS,
+)
+@pytest.mark.parametrize(
+    "response_sequence, expected_concurrency, expect_breaker_open",
+    [
+        ([_OK_RESPONSE], 1.5, False),
+        ([_OK_RESPONSE, _NO_CONTENT_RESPONSE], 2, False),
         (
-            "delete",
             [
+                _OK_RESPONSE,
+                _OK_RESPONSE,
                 {
-                    "status_code": 598,
-                    "raise_for_status.side_effect": requests.exceptions.Timeout,
+                    "status_code": 503,
+                    "raise_for_status.side_effect": requests.exceptions.HTTPError,
                 },
-                {"status_code": 200, "raise_for_status.side_effect": None},
             ],
-            RateLimits.WRITE_TIMEOUT_SECONDS * RateLimits.WAIT_INCREASE_SCALAR,
+            1,
+            True,
         ),
     ],
+    ids=["200", "200_then_204", "503_overload"],
 )
 @typechecked
-def test_base_caller_timeout_adjusting(
+def test_base_caller_concurrency_controller(
     request_type: RequestType,
+    caller_cls: type[BaseCaller],
     response_sequence: list[dict[str, Any]],
-    expected_timeout: float,
+    expected_concurrency: float,
+    expect_breaker_open: bool,
 ) -> None:
-    """Test timeout adjustment on timeout retry."""
-    with patch(f"requests.{request_type}") as mock_request:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
+    """Test calls report latency and overload to the class's concurrency controller."""
+    controller = ConcurrencyController(target_latency_seconds=60)
 
-        mock_caller = _caller_factory(request_type)
-        mock_caller.call_api()
+    with patch.object(requests.Session, request_type) as mock_request:
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
+        mock_caller = caller_cls()
+        caller_cls._concurrency_controller = controller
 
-        assert mock_caller.__class__._timeout == expected_timeout
+        for _ in response_sequence:
+            try:
+                mock_caller.call_api()
+            except requests.exceptions.HTTPError:
+                pass
+
+    assert controller.concurrency == expected_concurrency
+    assert controller.breaker_open == expect_breaker_open
+    assert controller._in_flight == 0
+
+
+class _CachedGetCaller(BaseGetCaller):
+    _cache_ttl = 60
+
+    def _set_url(self) -> None:
+        self._url = BASE_URL
+
+
+@typechecked
+def _cacheable_response(
+    status_code: int = 200, headers: dict[str, str] | None = None, data: Any = None
+) -> Mock:
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"data": data}
+    response.content = json.dumps({"data": data}).encode()
+
+    return response
+
+
+@pytest.mark.parametrize(
+    "first_headers, second_call_at, second_response, expected_calls, expected_data",
+    [
+        # Fresh: reused without calling.
+        ({}, 30, None, 1, 1),
+        # Expired without ETag: called again.
+        ({}, 90, _cacheable_response(data=2), 2, 2),
+        # Expired with ETag: revalidated and reused on 304.
+        ({"ETag": '"v1"'}, 90, _cacheable_response(status_code=304), 2, 1),
+        # Expired with ETag, changed: replaced.
+        ({"ETag": '"v1"'}, 90, _cacheable_response(data=2), 2, 2),
+        # max-age overrides `_cache_ttl`.
+        ({"Cache-Control": "max-age=120"}, 90, None, 1, 1),
+        ({"Cache-Control": "public, max-age=10"}, 30, _cacheable_response(data=2), 2, 2),
+        # no-store isn't cached, no-cache always revalidates.
+        ({"Cache-Control": "no-store"}, 30, _cacheable_response(data=2), 2, 2),
+        (
+            {"Cache-Control": "no-cache", "ETag": '"v1"'},
+            30,
+            _cacheable_response(status_code=304),
+            2,
+            1,
+        ),
+    ],
+    ids=[
+        "fresh",
+        "expired",
+        "etag_not_modified",
+        "etag_changed",
+        "max_age_fresh",
+        "max_age_expired",
+        "no_store",
+        "no_cache",
+    ],
+)
+@typechecked
+def test_get_caller_cache(
+    first_headers: dict[str, str],
+    second_call_at: float,
+    second_response: Mock | None,
+    expected_calls: int,
+    expected_data: int,
+) -> None:
+    """Test repeat GETs reuse, revalidate, or refetch cached responses.
+
+    Only calls that reach the API adjust the class wait time.
+    """
+    _CachedGetCaller.invalidate()
+    responses = [_cacheable_response(headers=first_headers, data=1), second_response]
+    wait_seconds = _CachedGetCaller._min_wait_seconds * 2
+
+    with patch.object(requests.Session, "get") as mock_request, patch.object(
+        api_callers, "monotonic"
+    ) as mock_monotonic:
+        mock_request.side_effect = responses[:expected_calls]
+
+        mock_monotonic.return_value = 0
+        _CachedGetCaller().call_api()
+
+        mock_monotonic.return_value = second_call_at
+        _CachedGetCaller._wait_seconds = wait_seconds
+        caller = _CachedGetCaller()
+        caller.call_api()
+
+    assert mock_request.call_count == expected_calls
+    assert caller.response_json == {"data": expected_data}
+    if expected_calls == 1:
+        assert _CachedGetCaller._wait_seconds == wait_seconds
+    else:
+        assert _CachedGetCaller._wait_seconds == pytest.approx(
+            wait_seconds * RateLimits.WAIT_DECREASE_SECONDS
+        )
+    if expected_calls == 2:
+        second_headers = mock_request.call_args.kwargs.get("headers", {})
+        assert second_headers.get("If-None-Match") == first_headers.get("ETag")
+
+
+@typechecked
+def test_get_caller_cache_hit_rate_headers() -> None:
+    """Test a cache hit doesn't pace the class again from the cached rate limit headers."""
+    _CachedGetCaller.invalidate()
+    rate_headers = {
+        "X-RateLimit-Limit": "100",
+        "X-RateLimit-Remaining": "1",
+        "X-RateLimit-Reset": "1060",
+    }
+
+    with patch.object(requests.Session, "get") as mock_request, patch.object(
+        api_callers, "time", return_value=1000
+    ):
+        mock_request.return_value = _cacheable_response(headers=rate_headers, data=1)
+        _CachedGetCaller().call_api()
+        assert _CachedGetCaller._wait_seconds == pytest.approx(60)
+
+        _CachedGetCaller._wait_seconds = _CachedGetCaller._min_wait_seconds
+        _CachedGetCaller().call_api()
+
+    assert mock_request.call_count == 1
+    assert _CachedGetCaller._wait_seconds == _CachedGetCaller._min_wait_seconds
+
+
+@typechecked
+def test_get_caller_cache_eviction() -> None:
+    """Test the cache drops least recently used responses, and can be invalidated."""
+    _CachedGetCaller.invalidate()
+    urls = [f"{BASE_URL}/{i}" for i in range(3)]
+
+    class _SmallCachedGetCaller(_CachedGetCaller):
+        _cache_maxsize = 2
+
+        def __init__(self, url: str) -> None:
+            self._url_to_set = url
+            super().__init__()
+
+        def _set_url(self) -> None:
+            self._url = self._url_to_set
+
+    with patch.object(requests.Session, "get") as mock_request:
+        mock_request.side_effect = lambda **kwargs: _cacheable_response(data=kwargs["url"])
+        for url in [urls[0], urls[1], urls[0], urls[2], urls[0], urls[1]]:
+            _SmallCachedGetCaller(url=url).call_api()
+
+        # urls[1] was least recently used when urls[2] was added.
+        assert [call.kwargs["url"] for call in mock_request.call_args_list] == [
+            urls[0],
+            urls[1],
+            urls[2],
+            urls[1],
+        ]
+
+        _SmallCachedGetCaller.invalidate(url=urls[0])
+        _SmallCachedGetCaller(url=urls[0]).call_api()
+        assert mock_request.call_args.kwargs["url"] == urls[0]
+        assert mock_request.call_count == 5
+
+
+class _LockCheckedCache(OrderedDict):
+    """A response cache that asserts its lock is held on every access."""
+
+    def __init__(self, lock: Any) -> None:
+        super().__init__()
+        self.lock = lock
+
+    def _check_locked(self) -> None:
+        assert self.lock.locked(), "Cache accessed without its lock."
+
+    def get(self, *args: Any) -> Any:
+        self._check_locked()
+        return super().get(*args)
+
+    def pop(self, *args: Any) -> Any:
+        self._check_locked()
+        return super().pop(*args)
+
+    def popitem(self, last: bool = True) -> Any:
+        self._check_locked()
+        return super().popitem(last=last)
+
+    def move_to_end(self, key: Any, last: bool = True) -> None:
+        self._check_locked()
+        super().move_to_end(key, last=last)
+
+    def clear(self) -> None:
+        self._check_locked()
+        super().clear()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._check_locked()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._check_locked()
+        super().__delitem__(key)
+
+    def __iter__(self) -> Iterator:
+        self._check_locked()
+        return super().__iter__()
+
+
+@typechecked
+def test_get_caller_cache_lock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test each class has its own cache lock, held on every cache access."""
+    assert _CachedGetCaller._cache_lock is not BaseGetCaller._cache_lock
+    assert _CachedGetCaller._cache_lock is not GetCaller._cache_lock
+
+    cache = _LockCheckedCache(lock=_CachedGetCaller._cache_lock)
+    monkeypatch.setattr(_CachedGetCaller, "_cache", cache)
+    responses = [
+        _cacheable_response(headers={"ETag": '"v1"'}, data=1),
+        _cacheable_response(status_code=304),
+        _cacheable_response(headers={"Cache-Control": "no-store"}, data=2),
+    ]
+
+    with patch.object(
+        requests.Session, "get", side_effect=responses
+    ) as mock_request, patch.object(api_callers, "monotonic") as mock_monotonic:
+        # Stored, reused while fresh, revalidated once expired, then dropped on no-store.
+        for call_at in [0, 30, 90, 200]:
+            mock_monotonic.return_value = call_at
+            _CachedGetCaller().call_api()
+        assert mock_request.call_count == 3
+
+    _CachedGetCaller.invalidate(url=BASE_URL)
+    _CachedGetCaller.invalidate()
+    assert not _CachedGetCaller._cache_lock.locked()
+
+
+class _BatchCaller(BaseBatchedPostCaller):
+    _max_batch_size = 2
+
+    def _set_url(self) -> None:
+        self._url = BASE_URL
+
+
+@pytest.mark.parametrize(
+    "n_payloads, expected_batches",
+    [
+        (0, []),
+        (1, [[0]]),
+        (2, [[0, 1]]),
+        (5, [[0, 1], [2, 3], [4]]),
+    ],
+)
+@typechecked
+def test_batched_post_caller(n_payloads: int, expected_batches: list[list[int]]) -> None:
+    """Test payloads are POSTed together in batches of up to `_max_batch_size`."""
+    with patch.object(requests.Session, "post") as mock_request:
+        mock_request.side_effect = (
+            _fake_response(status_code=200, **{"json.return_value": {"batch": i}})
+            for i in range(len(expected_batches))
+        )
+
+        with _BatchCaller() as batch_caller:
+            for i in range(n_payloads):
+                batch_caller.add(payload={"id": i})
+
+    sent_batches = [
+        [payload["id"] for payload in call.kwargs["json"]["requests"]]
+        for call in mock_request.call_args_list
+    ]
+    assert sent_batches == expected_batches
+    assert batch_caller.batch_responses == [
+        {"batch": i} for i in range(len(expected_batches))
+    ]
+    assert _BatchCaller._call_kwargs == {}
+    assert batch_caller._call_kwargs == {}
+
+
+@typechecked
+def test_batched_post_caller_interval() -> None:
+    """Test a pending batch is sent on `add` once it has waited `_batch_interval_seconds`."""
+    with patch.object(requests.Session, "post") as mock_request, patch.object(
+        api_callers, "monotonic", side_effect=[0, 1, 5]
+    ):
+        mock_request.return_value = Mock(status_code=204)
+        batch_caller = _BatchCaller()
+        batch_caller._max_batch_size = 10
+        batch_caller._batch_interval_seconds = 5
+
+        batch_caller.add(payload={"id": 0})
+        assert mock_request.call_count == 0
+        batch_caller.add(payload={"id": 1})
+
+    assert mock_request.call_count == 1
+    assert mock_request.call_args.kwargs["json"] == {"requests": [{"id": 0}, {"id": 1}]}
 
 
 @pytest.mark.parametrize(
@@ -372,27 +1284,27 @@ def test_base_caller_timeout_adjusting(
         ([{"status_code": 200, "json.return_value": {"nextPageToken": None}}]),
         ([{"status_code": 200, "json.return_value": {}}]),
     ],
+    ids=["next_page", "last_page", "no_token"],
 )
+@patch.object(requests.Session, "get")
 @typechecked
-def test_paged_getter(response_sequence: list[dict[str, Any]]) -> None:
+def test_paged_getter(mock_request: Mock, response_sequence: list[dict[str, Any]]) -> None:
     """Test PagedResponseGetterBFB."""
-    with patch("requests.get") as mock_request:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
+    mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
 
-        page_url = "https://example.com/api/test"
-        caller = BasePagedResponseGetter(page_url=page_url)
-        caller.call_api()
-        assert mock_request.call_args_list[0][1]["url"] == page_url
-        assert caller.next_page_salsa == response_sequence[-1]["json.return_value"].get(
-            "nextPageToken", None
-        )
+    caller = BasePagedResponseGetter(page_url=BASE_URL)
+    caller.call_api()
+    assert mock_request.call_args_list[0][1]["url"] == BASE_URL
+    assert caller.next_page_salsa == response_sequence[-1]["json.return_value"].get(
+        "nextPageToken", None
+    )
 
 
 @pytest.mark.parametrize(
     "page_url, params, expected_url, error_context",
     [
-        (BASE_URL, {}, BASE_URL, nullcontext()),
-        (BASE_URL, {"foo": "bar"}, BASE_URL + "?foo=bar", nullcontext()),
+        (BASE_URL, {}, BASE_URL, None),
+        (BASE_URL, {"foo": "bar"}, BASE_URL + "?foo=bar", None),
         (
             BASE_URL + "?foo=bar",
             {"foo": "baz"},
@@ -405,7 +1317,7 @@ def test_paged_getter(response_sequence: list[dict[str, Any]]) -> None:
             BASE_URL + "?foo=bar",
             {"qux": "quux"},
             BASE_URL + "?foo=bar&qux=quux",
-            nullcontext(),
+            None,
         ),
         (
             BASE_URL + "?foo=bar",
@@ -416,42 +1328,67 @@ def test_paged_getter(response_sequence: list[dict[str, Any]]) -> None:
                 match="Duplicate entries found in query string",
             ),
         ),
-        (BASE_URL, {"foo": "bar baz"}, BASE_URL + "?foo=bar+baz", nullcontext()),
-        (BASE_URL, {"foo": "bar\nbaz"}, BASE_URL + "?foo=bar%0Abaz", nullcontext()),
-        (BASE_URL, {"foo": "bar\rbaz"}, BASE_URL + "?foo=bar%0Dbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar\tbaz"}, BASE_URL + "?foo=bar%09baz", nullcontext()),
-        (BASE_URL, {"foo": 'bar"baz'}, BASE_URL + "?foo=bar%22baz", nullcontext()),
-        (BASE_URL, {"foo": "bar<baz"}, BASE_URL + "?foo=bar%3Cbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar>baz"}, BASE_URL + "?foo=bar%3Ebaz", nullcontext()),
-        (BASE_URL, {"foo": "bar#baz"}, BASE_URL + "?foo=bar%23baz", nullcontext()),
-        (BASE_URL, {"foo": "bar%baz"}, BASE_URL + "?foo=bar%25baz", nullcontext()),
-        (BASE_URL, {"foo": "bar[baz"}, BASE_URL + "?foo=bar%5Bbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar]baz"}, BASE_URL + "?foo=bar%5Dbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar{baz"}, BASE_URL + "?foo=bar%7Bbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar}baz"}, BASE_URL + "?foo=bar%7Dbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar|baz"}, BASE_URL + "?foo=bar%7Cbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar\\baz"}, BASE_URL + "?foo=bar%5Cbaz", nullcontext()),
-        (BASE_URL, {"foo": "bar^baz"}, BASE_URL + "?foo=bar%5Ebaz", nullcontext()),
     ],
 )
 @typechecked
 def test_paged_getter_params(
-    page_url: str, params: dict, expected_url: str, error_context: AbstractContextManager
+    page_url: str,
+    params: dict,
+    expected_url: str,
+    error_context: AbstractContextManager | None,
 ) -> None:
     """Test addition of query string parameters in `page_url`."""
     response_sequence: list[dict[str, Any]] = [
         {"json.return_value": {"data": [1, 2, 3]}, "status_code": 200}
     ]
-    with patch("requests.get") as mock_request, error_context:
-        mock_request.side_effect = [Mock(**resp) for resp in response_sequence]
+    with patch.object(
+        requests.Session, "get"
+    ) as mock_request, error_context or nullcontext():
+        mock_request.side_effect = (_fake_response(**resp) for resp in response_sequence)
 
         caller = BasePagedResponseGetter(page_url=page_url, params=params)
         caller.call_api()
         assert mock_request.call_args_list[0][1]["url"] == expected_url
 
 
+#: Characters that must be percent-encoded in query parameter values, and their encodings.
+_PARAM_ENCODINGS: Final[tuple[tuple[str, str], ...]] = (
+    (" ", "+"),
+    ("\n", "%0A"),
+    ("\r", "%0D"),
+    ("\t", "%09"),
+    ('"', "%22"),
+    ("<", "%3C"),
+    (">", "%3E"),
+    ("#", "%23"),
+    ("%", "%25"),
+    ("[", "%5B"),
+    ("]", "%5D"),
+    ("{", "%7B"),
+    ("}", "%7D"),
+    ("|", "%7C"),
+    ("\\", "%5C"),
+    ("^", "%5E"),
+)
+
+
+@typechecked
+def test_paged_getter_param_encoding() -> None:
+    """Test query string parameter values are percent-encoded in `page_url`."""
+    response = _fake_response(**{"json.return_value": {"data": []}, "status_code": 200})
+    with patch.object(requests.Session, "get", return_value=response) as mock_request:
+        for char, encoding in _PARAM_ENCODINGS:
+            caller = BasePagedResponseGetter(
+                page_url=BASE_URL, params={"foo": f"bar{char}baz"}
+            )
+            caller.call_api()
+            assert mock_request.call_args.kwargs["url"] == f"{BASE_URL}?foo=bar{encoding}baz"
+
+    assert mock_request.call_count == len(_PARAM_ENCODINGS)
+
+
 @pytest.mark.parametrize(
-    "responses, expected_result, error_context",
+    "responses, expected_result",
     [
         (
             [
@@ -461,7 +1398,6 @@ def test_paged_getter_params(
                 }
             ],
             [{"data": [1, 2, 3], "nextPageToken": None}],
-            nullcontext(),
         ),
         (
             [
@@ -475,7 +1411,6 @@ def test_paged_getter_params(
                 },
             ],
             [{"data": [1], "nextPageToken": "abc"}, {"data": [2], "nextPageToken": None}],
-            nullcontext(),
         ),
         (
             [
@@ -492,84 +1427,44 @@ def test_paged_getter_params(
                 },
             ],
             [{"data": [3], "nextPageToken": "asfg"}, {"data": [54], "nextPageToken": None}],
-            nullcontext(),
-        ),
-        (
-            [
-                {
-                    "json.return_value": {},
-                    "status_code": 400,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError(),
-                }
-            ],
-            None,
-            pytest.raises(requests.exceptions.HTTPError),
-        ),
-        (
-            [
-                {
-                    "json.return_value": {},
-                    "status_code": 401,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError(),
-                }
-            ],
-            None,
-            pytest.raises(requests.exceptions.HTTPError),
-        ),
-        (
-            [
-                {
-                    "json.return_value": {},
-                    "status_code": 403,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError(),
-                }
-            ],
-            None,
-            pytest.raises(requests.exceptions.HTTPError),
-        ),
-        (
-            [
-                {
-                    "json.return_value": {},
-                    "status_code": 404,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError(),
-                }
-            ],
-            None,
-            pytest.raises(requests.exceptions.HTTPError),
-        ),
-        (
-            [
-                {
-                    "json.return_value": {},
-                    "status_code": 500,
-                    "raise_for_status.side_effect": requests.exceptions.HTTPError(),
-                }
-            ],
-            None,
-            pytest.raises(requests.exceptions.HTTPError),
         ),
     ],
+    ids=["one_page", "two_pages", "429_retries"],
 )
+@patch.object(requests.Session, "get")
 @typechecked
 def test_get_responses_returns(
-    responses: list[dict[str, Any]],
-    expected_result: list[dict[str, Any]] | None,
-    error_context: AbstractContextManager,
+    mock_get: Mock, responses: list[dict[str, Any]], expected_result: list[dict[str, Any]]
 ) -> None:
     """Test get_responses function."""
-    with patch("requests.get") as mock_get:
-        mock_get.side_effect = [Mock(**resp) for resp in responses]
+    mock_get.side_effect = (_fake_response(**resp) for resp in responses)
+
+    result = get_responses(url=BASE_URL, paged_response_class=BasePagedResponseGetter)
 
-        with error_context:
-            result = get_responses(url=BASE_URL, paged_response_class=BasePagedResponseGetter)
-            assert result == expected_result
+    assert result == expected_result
+    assert mock_get.call_count == len(responses)
 
-        assert mock_get.call_count == len(responses)
+
+@pytest.mark.parametrize("status_code", [400, 401, 403, 404, 500])
+@typechecked
+def test_get_responses_raises(status_code: int) -> None:
+    """Test get_responses raises on error responses."""
+    response = _fake_response(
+        **{
+            "json.return_value": {},
+            "status_code": status_code,
+            "raise_for_status.side_effect": requests.exceptions.HTTPError(),
+        }
+    )
+    with patch.object(requests.Session, "get", return_value=response) as mock_get:
+        with pytest.raises(requests.exceptions.HTTPError):
+            get_responses(url=BASE_URL, paged_response_class=BasePagedResponseGetter)
+
+    assert mock_get.call_count == 1
 
 
 @pytest.mark.parametrize(
-    "params, responses",
+    "params, responses, expected_urls",
     [
         (
             "",
@@ -579,6 +1474,7 @@ def test_get_responses_returns(
                     "status_code": 200,
                 }
             ],
+            [BASE_URL],
         ),
         (
             "",
@@ -592,6 +1488,7 @@ def test_get_responses_returns(
                     "status_code": 200,
                 },
             ],
+            [BASE_URL, f"{BASE_URL}?pageToken=abc"],
         ),
         (
             "",
@@ -608,6 +1505,13 @@ def test_get_responses_returns(
                     "status_code": 200,
                 },
             ],
+            [
+                BASE_URL,
+                BASE_URL,
+                BASE_URL,
+                f"{BASE_URL}?pageToken=asfg",
+                f"{BASE_URL}?pageToken=asfg",
+            ],
         ),
         (
             "?filter.startsGte=2015-12-12&filter.startsLTE=2021-06-25",
@@ -621,33 +1525,136 @@ def test_get_responses_returns(
                     "status_code": 200,
                 },
             ],
+            [
+                f"{BASE_URL}?filter.startsGte=2015-12-12&filter.startsLTE=2021-06-25",
+                f"{BASE_URL}?filter.startsGte=2015-12-12&filter.startsLTE=2021-06-25"
+                "&pageToken=abc",
+            ],
         ),
     ],
+    ids=["one_page", "two_pages", "429_retries", "query_params"],
 )
+@patch.object(requests.Session, "get")
 @typechecked
-def test_get_responses_urls(responses: list[dict[str, Any]], params: str) -> None:
+def test_get_responses_urls(
+    mock_get: Mock, params: str, responses: list[dict[str, Any]], expected_urls: list[str]
+) -> None:
     """Test get_responses function."""
-    base_url = f"{BASE_URL}{params}"
-    with patch("requests.get") as mock_get:
-        mock_get.side_effect = [Mock(**resp) for resp in responses]
-
-        _ = get_responses(url=base_url, paged_response_class=BasePagedResponseGetter)
-
-        expected_urls = [base_url]
-        last_next_page_token = None
-        for resp in responses:
-            next_page_token = resp["json.return_value"].get("nextPageToken")
-            if next_page_token or (not next_page_token and resp["status_code"] == 429):
-                if resp["status_code"] == 429:
-                    next_page_token = last_next_page_token
-                last_next_page_token = next_page_token
-
-                token_prefix = "?" if "?" not in base_url else "&"
-                token = (
-                    f"{token_prefix}pageToken={next_page_token}" if next_page_token else ""
-                )
-                expected_urls.append(f"{base_url}{token}")
-
-        actual_urls = [call[1]["url"] for call in mock_get.call_args_list]
-
-        assert actual_urls == expected_urls
+    mock_get.side_effect = (_fake_response(**resp) for resp in responses)
+
+    _ = get_responses(url=f"{BASE_URL}{params}", paged_response_class=BasePagedResponseGetter)
+
+    actual_urls = [call[1]["url"] for call in mock_get.call_args_list]
+    assert actual_urls == expected_urls
+
+
+@typechecked
+def test_iter_responses() -> None:
+    """Test iter_responses yields each page before requesting the next."""
+    responses = [
+        {"json.return_value": {"data": [1], "nextPageToken": "abc"}, "status_code": 200},
+        {"json.return_value": {"data": [2], "nextPageToken": None}, "status_code": 200},
+    ]
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = (_fake_response(**resp) for resp in responses)
+
+        pages = iter_responses(url=BASE_URL, paged_response_class=BasePagedResponseGetter)
+        assert mock_get.call_count == 0
+
+        assert next(pages) == {"data": [1], "nextPageToken": "abc"}
+        assert mock_get.call_count == 1
+
+        assert list(pages) == [{"data": [2], "nextPageToken": None}]
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    "content, expected_response_dict",
+    [
+        (b'{"data": [1, 2, 3]}', {"data": [1, 2, 3]}),
+        (
+            b'{"data": 123456789012345678901234567890}',
+            {"data": 123456789012345678901234567890},
+        ),
+        ('{"data": [1, 2, 3]}'.encode("utf-16"), {"data": [1, 2, 3]}),
+        (
+            b"<html>Bad Gateway</html>",
+            {"reason": "Bad Gateway", "additional_notes": "No-JSON response."},
+        ),
+    ],
+    ids=["json", "big_int", "utf_16", "not_json"],
+)
+@typechecked
+def test_get_response_dict(
+    use_orjson: bool, content: bytes, expected_response_dict: dict[str, Any]
+) -> None:
+    """Test get_response_dict parses JSON, with or without orjson, and handles non-JSON."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+
+    response = requests.Response()
+    response._content = content
+    response.reason = "Bad Gateway"
+
+    with patch.object(api_callers, "orjson", api_callers.orjson if use_orjson else None):
+        response_dict = get_response_dict(response=response)
+
+    assert response_dict.items() >= expected_response_dict.items()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@typechecked
+def test_parse_json_error(use_orjson: bool) -> None:
+    """Test invalid JSON raises the requests error, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+
+    response = requests.Response()
+    response._content = b"<html>Bad Gateway</html>"
+
+    with patch.object(
+        api_callers, "orjson", api_callers.orjson if use_orjson else None
+    ), pytest.raises(requests.exceptions.JSONDecodeError):
+        api_callers._parse_json(response=response)
+
+
+@pytest.mark.parametrize(
+    "page_list, expected_data",
+    [
+        ([], []),
+        ([{"data": []}], []),
+        ([{"data": [{"id": 1}, {"id": 2}]}], [{"id": 1}, {"id": 2}]),
+        (
+            [{"data": [{"id": 1}, {"id": 2}]}, {"data": []}, {"data": [{"id": 3}]}],
+            [{"id": 1}, {"id": 2}, {"id": 3}],
+        ),
+    ],
+)
+@typechecked
+def test_concat_response_pages(
+    page_list: list[dict[str, Any]], expected_data: list[dict[str, Any]]
+) -> None:
+    """Test concat_response_pages flattens the data lists in page order."""
+    assert concat_response_pages(page_list=page_list, data_key="data") == expected_data
+
+
+@typechecked
+def test_concat_response_pages_arrow() -> None:
+    """Test concat_response_pages_arrow matches concat_response_pages, filling gaps."""
+    pa = pytest.importorskip("pyarrow")
+    page_list: list[dict[str, Any]] = [
+        {"data": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]},
+        {"data": []},
+        {"data": [{"id": 3.5}]},
+    ]
+
+    table = concat_response_pages_arrow(page_list=page_list, data_key="data")
+
+    assert table.schema.field("id").type == pa.float64()
+    assert table.to_pylist() == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": "b"},
+        {"id": 3.5, "name": None},
+    ]
+    assert concat_response_pages_arrow(page_list=[], data_key="data").num_rows == 0
@@ -0,0 +1,353 @@
+"""A test suite for the async API callers module."""
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
+from threading import Barrier, Thread
+from typing import Any, Final
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from comb_utils.lib import errors
+from comb_utils.lib.constants import RateLimits
+from tests.unit.utils import typechecked
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from comb_utils.lib.api_callers_async import (  # noqa: E402
+    AsyncBaseGetCaller,
+    AsyncBasePagedResponseGetter,
+    aiter_responses,
+)
+
+BASE_URL: Final[str] = "https://example.com/api/test"
+
+
+@pytest.fixture(autouse=True)
+@typechecked
+def mock_async_sleep() -> Iterator[None]:
+    """Mock `asyncio.sleep` in the async callers to avoid waiting in tests."""
+    with patch("comb_utils.lib.api_callers_async.sleep", new=AsyncMock()):
+        yield
+
+
+@typechecked
+def _mock_response(
+    status: int, json: dict[str, Any] | None = None, headers: dict[str, str] | None = None
+) -> MagicMock:
+    """Make a mock session request context manager yielding a mock response."""
+    response = Mock(spec=aiohttp.ClientResponse)
+    response.status = status
+    response.json = AsyncMock(return_value=json)
+    response.text = AsyncMock(return_value=str(json))
+    response.request_info = Mock()
+    response.history = ()
+    response.headers = headers or {}
+
+    context_manager = MagicMock()
+    context_manager.__aenter__.return_value = response
+
+    return context_manager
+
+
+@typechecked
+def _request_side_effect(sequence: list[Any]) -> list[Any]:
+    """Map (status, json[, headers]) tuples to mock responses, passing exceptions through."""
+    return [
+        item if isinstance(item, BaseException) else _mock_response(*item)
+        for item in sequence
+    ]
+
+
+class AsyncGetCaller(AsyncBaseGetCaller):
+    """A concrete async GET caller for tests."""
+
+    def _set_url(self) -> None:
+        self._url = BASE_URL
+
+
+@pytest.mark.parametrize(
+    "response_sequence, expected_result, expected_wait_time, error_context",
+    [
+        (
+            [(200, {"data": [1, 2, 3]})],
+            {"data": [1, 2, 3]},
+            RateLimits.READ_SECONDS,
+            None,
+        ),
+        ([(204, None)], {}, RateLimits.READ_SECONDS, None),
+        (
+            [(429, {}), (200, {"data": [5, 6]})],
+            {"data": [5, 6]},
+            RateLimits.READ_SECONDS
+            * RateLimits.WAIT_INCREASE_SCALAR
+            * RateLimits.WAIT_DECREASE_SECONDS,
+            None,
+        ),
+        (
+            [asyncio.TimeoutError(), (200, {"data": [7, 8]})],
+            {"data": [7, 8]},
+            RateLimits.READ_SECONDS,
+            None,
+        ),
+        (
+            [(400, {"error": "bad"})],
+            None,
+            RateLimits.READ_SECONDS,
+            pytest.raises(aiohttp.ClientResponseError, match="Got 400 response"),
+        ),
+        (
+            [(302, {})],
+            None,
+            RateLimits.READ_SECONDS,
+            pytest.raises(ValueError, match="Unexpected response 302"),
+        ),
+        (
+            [(429, {})] * (RateLimits.MAX_RETRIES + 1),
+            None,
+            RateLimits.MAX_WAIT_SECONDS,
+            pytest.raises(errors.MaxRetriesExceeded),
+        ),
+    ],
+    ids=["200", "204", "429_then_200", "timeout_then_200", "400", "302", "429_max_retries"],
+)
+@typechecked
+def test_async_caller_response_handling(
+    response_sequence: list[Any],
+    expected_result: dict[str, Any] | None,
+    expected_wait_time: float,
+    error_context: AbstractContextManager | None,
+) -> None:
+    """Test `call_api` handling of different HTTP responses, including retries."""
+    AsyncGetCaller._wait_seconds = RateLimits.READ_SECONDS
+    AsyncGetCaller._timeout = RateLimits.READ_TIMEOUT_SECONDS
+
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = _request_side_effect(response_sequence)
+        caller = AsyncGetCaller()
+
+        with error_context or nullcontext():
+            asyncio.run(caller.call_api())
+            assert caller.response_json == expected_result
+
+        assert mock_request.call_count == len(response_sequence)
+        assert AsyncGetCaller._wait_seconds == expected_wait_time
+
+        for call in mock_request.call_args_list:
+            assert call.kwargs["method"] == "GET"
+            assert call.kwargs["url"] == BASE_URL
+
+
+@typechecked
+def test_async_caller_timeout_adjusting() -> None:
+    """Test timeout adjustment on timeout retry."""
+    AsyncGetCaller._timeout = RateLimits.READ_TIMEOUT_SECONDS
+
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = _request_side_effect([asyncio.TimeoutError(), (200, {})])
+        asyncio.run(AsyncGetCaller().call_api())
+
+    assert (
+        AsyncGetCaller._timeout
+        == RateLimits.READ_TIMEOUT_SECONDS * RateLimits.WAIT_INCREASE_SCALAR
+    )
+
+
+@typechecked
+def test_async_session_reuse() -> None:
+    """Test instances of a class share one session, recreated after closing."""
+
+    async def _sessions() -> tuple[Any, Any, Any]:
+        first_session = await AsyncGetCaller()._get_session()
+        second_session = await AsyncGetCaller()._get_session()
+        await AsyncGetCaller.close()
+        third_session = await AsyncGetCaller()._get_session()
+        await AsyncGetCaller.close()
+
+        return first_session, second_session, third_session
+
+    first_session, second_session, third_session = asyncio.run(_sessions())
+
+    assert first_session is second_session
+    assert first_session.closed
+    assert third_session is not first_session
+
+
+@typechecked
+def test_async_session_new_loop() -> None:
+    """Test a session left open by a finished event loop is closed by the next loop."""
+
+    async def _session() -> Any:
+        return await AsyncGetCaller()._get_session()
+
+    first_session = asyncio.run(_session())
+    second_session = asyncio.run(_session())
+    asyncio.run(AsyncGetCaller.close())
+
+    assert first_session.closed
+    assert second_session is not first_session
+
+
+@typechecked
+def test_async_session_threads() -> None:
+    """Test threads running their own loops don't replace or close each other's sessions."""
+    barrier = Barrier(2, timeout=1)
+    sessions: dict[str, list[Any]] = {"first": [], "second": []}
+
+    async def _first() -> None:
+        sessions["first"].append(await AsyncGetCaller()._get_session())
+        barrier.wait()
+        barrier.wait()
+        sessions["first"].append(await AsyncGetCaller()._get_session())
+        sessions["first"].append(sessions["first"][0].closed)
+        await AsyncGetCaller.close()
+
+    async def _second() -> None:
+        barrier.wait()
+        sessions["second"].append(await AsyncGetCaller()._get_session())
+        barrier.wait()
+        await AsyncGetCaller.close()
+
+    threads = [
+        Thread(target=asyncio.run, args=(_first(),)),
+        Thread(target=asyncio.run, args=(_second(),)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    first_session, first_session_again, first_session_closed = sessions["first"]
+    assert first_session_again is first_session
+    assert not first_session_closed
+    assert sessions["second"][0] is not first_session
+
+
+@typechecked
+def test_async_caller_json_content_type() -> None:
+    """Test JSON bodies are parsed whatever their `Content-Type`, like the sync callers."""
+
+    async def _handle(request: web.Request) -> web.Response:
+        return web.Response(text='{"data": [1, 2, 3]}', content_type="text/plain")
+
+    async def _call() -> dict[str, Any]:
+        app = web.Application()
+        app.router.add_get("/", _handle)
+        async with TestServer(app) as server:
+
+            class LocalCaller(AsyncBaseGetCaller):
+                def _set_url(self) -> None:
+                    self._url = str(server.make_url("/"))
+
+            caller = LocalCaller()
+            await caller.call_api()
+            await LocalCaller.close()
+
+        return caller.response_json
+
+    assert asyncio.run(_call()) == {"data": [1, 2, 3]}
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected_wait_time",
+    [
+        ("3", 3 * RateLimits.WAIT_DECREASE_SECONDS),
+        ("Sun Nov  6 08:49:37 1994", RateLimits.READ_SECONDS),
+        (
+            "soon",
+            RateLimits.READ_SECONDS
+            * RateLimits.WAIT_INCREASE_SCALAR
+            * RateLimits.WAIT_DECREASE_SECONDS,
+        ),
+        ("100000", RateLimits.MAX_WAIT_SECONDS * RateLimits.WAIT_DECREASE_SECONDS),
+    ],
+    ids=["seconds", "past_asctime_date", "malformed", "seconds_over_cap"],
+)
+@typechecked
+def test_async_caller_retry_after(retry_after: str, expected_wait_time: float) -> None:
+    """Test a 429's `Retry-After` sets the wait time, within the min and max wait times."""
+    AsyncGetCaller._wait_seconds = RateLimits.READ_SECONDS
+
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = _request_side_effect(
+            [(429, {}, {"Retry-After": retry_after}), (200, {})]
+        )
+        asyncio.run(AsyncGetCaller().call_api())
+
+    assert AsyncGetCaller._wait_seconds == pytest.approx(expected_wait_time)
+
+
+@pytest.mark.parametrize(
+    "params, expected_url",
+    [
+        (None, BASE_URL),
+        ({"foo": "bar baz"}, BASE_URL + "?foo=bar+baz"),
+    ],
+)
+@typechecked
+def test_async_paged_getter(params: dict[str, str] | None, expected_url: str) -> None:
+    """Test the paged getter sets the URL and next page token."""
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = _request_side_effect([(200, {"nextPageToken": "abc"})])
+        getter = AsyncBasePagedResponseGetter(page_url=BASE_URL, params=params)
+        asyncio.run(getter.call_api())
+
+    assert mock_request.call_args.kwargs["url"] == expected_url
+    assert getter.next_page_salsa == "abc"
+
+
+@typechecked
+def test_async_paged_getter_duplicates() -> None:
+    """Test the paged getter rejects duplicate query string keys."""
+    with pytest.raises(errors.DuplicateKeysDetected):
+        AsyncBasePagedResponseGetter(page_url=BASE_URL + "?foo=bar", params={"foo": "baz"})
+
+
+@typechecked
+def test_fetch_all() -> None:
+    """Test `fetch_all` returns pages in order, with failures in place."""
+    page_urls = [f"{BASE_URL}?page={page}" for page in range(3)]
+    responses: dict[str, tuple[int, dict[str, Any]]] = {
+        page_urls[0]: (200, {"data": [0]}),
+        page_urls[1]: (400, {"error": "bad"}),
+        page_urls[2]: (200, {"data": [2]}),
+    }
+
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = lambda **kwargs: _mock_response(*responses[kwargs["url"]])
+        results = asyncio.run(
+            AsyncBasePagedResponseGetter.fetch_all(page_urls=page_urls, concurrency=2)
+        )
+
+    assert results[0] == {"data": [0]}
+    assert isinstance(results[1], aiohttp.ClientResponseError)
+    assert results[2] == {"data": [2]}
+
+
+@typechecked
+def test_aiter_responses() -> None:
+    """Test aiter_responses yields pages in order, following the page tokens."""
+
+    async def _pages() -> list[dict[str, Any]]:
+        return [
+            page
+            async for page in aiter_responses(
+                url=BASE_URL, paged_response_class=AsyncBasePagedResponseGetter
+            )
+        ]
+
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.side_effect = _request_side_effect(
+            [(200, {"data": [1], "nextPageToken": "abc"}), (200, {"data": [2]})]
+        )
+        pages = asyncio.run(_pages())
+
+    assert pages == [{"data": [1], "nextPageToken": "abc"}, {"data": [2]}]
+    assert [call.kwargs["url"] for call in mock_request.call_args_list] == [
+        BASE_URL,
+        BASE_URL + "?pageToken=abc",
+    ]
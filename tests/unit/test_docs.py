@@ -1,131 +1,123 @@
 """Tests for the docs module."""
 
-from typing import Final
-
-import pytest
+from functools import cache
+from typing import Any, Final
 
 from comb_utils import DocString, ErrorDocString
 
+#: Docstring parts shared by the cases below. None of the tests mutate them.
+_OPENING: Final[str] = "Test opening"
+_ERR1: Final[ErrorDocString] = ErrorDocString(
+    error_type="Error1", docstring="Error1 docstring"
+)
+_ERR2: Final[ErrorDocString] = ErrorDocString(
+    error_type="Error2", docstring="Error2 docstring"
+)
+_ARGS: Final[dict[str, str]] = {"arg1": "arg1 docstring", "arg2": "arg2 docstring"}
+_RETURNS: Final[list[str]] = ["return1", "return2"]
+
 
-@pytest.mark.parametrize(
-    "docstring, expected_docstring",
-    [
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[
-                    ErrorDocString(error_type="Error1", docstring="Error1 docstring"),
-                    ErrorDocString(error_type="Error2", docstring="Error2 docstring"),
-                ],
-                returns=["return1", "return2"],
-            ),
+def _mk(**overrides: Any) -> DocString:
+    """Build a test DocString from the shared parts, overriding the given ones."""
+    parts: dict[str, Any] = {
+        "opening": _OPENING,
+        "args": _ARGS,
+        "raises": [_ERR1, _ERR2],
+        "returns": _RETURNS,
+    }
+    parts.update(overrides)
+
+    return DocString(**parts)
+
+
+@cache
+def _docstring_cases() -> dict[str, tuple[DocString, str, str]]:
+    """Named docstrings paired with their expected API and CLI formats.
+
+    Built on first use, so runs that deselect the docstring tests don't build them.
+    """
+    return {
+        "all_parts": (
+            _mk(),
             (
                 "Test opening\n\n\n"
                 "Args:\n\n\n  arg1: arg1 docstring\n\n  arg2: arg2 docstring\n\n\n"
                 "Raises:\n\n\n  Error1: Error1 docstring\n\n  Error2: Error2 docstring\n\n\n"
                 "Returns:\n\n\n  return1\n\n  return2\n"
             ),
-        ),
-        (
-            DocString(
-                opening="Test opening",
-                args={},
-                raises=[ErrorDocString(error_type="Error1", docstring="Error1 docstring")],
-                returns=["return1", "return2"],
-            ),
             (
                 "Test opening\n\n\n"
-                "Raises:\n\n\n  Error1: Error1 docstring\n\n\n"
+                "Raises:\n\n\n  Error1: Error1 docstring\n\n  Error2: Error2 docstring\n\n\n"
                 "Returns:\n\n\n  return1\n\n  return2\n"
             ),
         ),
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[],
-                returns=["return1", "return2"],
-            ),
+        "no_args": (
+            _mk(args={}, raises=[_ERR1]),
             (
                 "Test opening\n\n\n"
-                "Args:\n\n\n  arg1: arg1 docstring\n\n  arg2: arg2 docstring\n\n\n"
+                "Raises:\n\n\n  Error1: Error1 docstring\n\n\n"
                 "Returns:\n\n\n  return1\n\n  return2\n"
             ),
-        ),
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[ErrorDocString(error_type="Error1", docstring="Error1 docstring")],
-                returns=[],
-            ),
             (
                 "Test opening\n\n\n"
-                "Args:\n\n\n  arg1: arg1 docstring\n\n  arg2: arg2 docstring\n\n\n"
-                "Raises:\n\n\n  Error1: Error1 docstring\n"
+                "Raises:\n\n\n  Error1: Error1 docstring\n\n\n"
+                "Returns:\n\n\n  return1\n\n  return2\n"
             ),
         ),
-    ],
-)
-def test_api_docstring(docstring: DocString, expected_docstring: str) -> None:
-    """Test the DocString class."""
-    assert docstring.api_docstring == expected_docstring
-
-
-@pytest.mark.parametrize(
-    "docstring, expected_docstring",
-    [
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[
-                    ErrorDocString(error_type="Error1", docstring="Error1 docstring"),
-                    ErrorDocString(error_type="Error2", docstring="Error2 docstring"),
-                ],
-                returns=["return1", "return2"],
-            ),
+        "no_raises": (
+            _mk(raises=[]),
             (
                 "Test opening\n\n\n"
-                "Raises:\n\n\n  Error1: Error1 docstring\n\n  Error2: Error2 docstring\n\n\n"
+                "Args:\n\n\n  arg1: arg1 docstring\n\n  arg2: arg2 docstring\n\n\n"
                 "Returns:\n\n\n  return1\n\n  return2\n"
             ),
-        ),
-        (
-            DocString(
-                opening="Test opening",
-                args={},
-                raises=[ErrorDocString(error_type="Error1", docstring="Error1 docstring")],
-                returns=["return1", "return2"],
-            ),
-            "Test opening\n\n\n"
-            "Raises:\n\n\n  Error1: Error1 docstring\n\n\n"
-            "Returns:\n\n\n  return1\n\n  return2\n",
-        ),
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[],
-                returns=["return1", "return2"],
-            ),
             "Test opening\n\n\nReturns:\n\n\n  return1\n\n  return2\n",
         ),
-        (
-            DocString(
-                opening="Test opening",
-                args={"arg1": "arg1 docstring", "arg2": "arg2 docstring"},
-                raises=[ErrorDocString(error_type="Error1", docstring="Error1 docstring")],
-                returns=[],
+        "no_returns": (
+            _mk(raises=[_ERR1], returns=[]),
+            (
+                "Test opening\n\n\n"
+                "Args:\n\n\n  arg1: arg1 docstring\n\n  arg2: arg2 docstring\n\n\n"
+                "Raises:\n\n\n  Error1: Error1 docstring\n"
             ),
             "Test opening\n\n\nRaises:\n\n\n  Error1: Error1 docstring\n",
         ),
-    ],
-)
-def test_cli_docstring(docstring: DocString, expected_docstring: str) -> None:
+    }
+
+
+def test_api_docstring() -> None:
+    """Test the DocString class."""
+    failures = [
+        f"{name}: {docstring.api_docstring!r} != {expected!r}"
+        for name, (docstring, expected, _) in _docstring_cases().items()
+        if docstring.api_docstring != expected
+    ]
+    assert not failures, "\n".join(failures)
+
+
+def test_cli_docstring() -> None:
     """Test the DocString class."""
-    assert docstring.cli_docstring == expected_docstring
+    failures = [
+        f"{name}: {docstring.cli_docstring!r} != {expected!r}"
+        for name, (docstring, _, expected) in _docstring_cases().items()
+        if docstring.cli_docstring != expected
+    ]
+    assert not failures, "\n".join(failures)
+
+
+def test_docstring_cache() -> None:
+    """Test the formatted docstrings are cached until an attribute is set."""
+    docstring = DocString(opening="Test opening", args={}, raises=[], returns=[])
+    api_docstring = docstring.api_docstring
+    cli_docstring = docstring.cli_docstring
+
+    assert docstring.api_docstring is api_docstring
+    assert docstring.cli_docstring is cli_docstring
+
+    docstring.returns = ["return1"]
+
+    assert docstring.api_docstring == "Test opening\n\n\nReturns:\n\n\n  return1\n"
+    assert docstring.cli_docstring == "Test opening\n\n\nReturns:\n\n\n  return1\n"
 
 
 def test_defaults() -> None:
@@ -0,0 +1,35 @@
+"""A test suite for the package inits."""
+
+import subprocess
+import sys
+
+import pytest
+
+import comb_utils
+from comb_utils import lib
+from tests.unit.utils import typechecked
+
+
+@typechecked
+def test_lazy_import() -> None:
+    """Test importing the package doesn't import the caller modules until they're used."""
+    code = (
+        "import sys, comb_utils\n"
+        "assert 'comb_utils.lib.api_callers' not in sys.modules\n"
+        "assert 'requests' not in sys.modules\n"
+        "comb_utils.BaseGetCaller\n"
+        "assert 'comb_utils.lib.api_callers' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("module", [comb_utils, lib])
+@typechecked
+def test_exports(module: object) -> None:
+    """Test every export resolves and is listed, and unknown names still raise."""
+    for name in module.__all__:  # type: ignore[attr-defined]
+        assert getattr(module, name) is getattr(lib, name)
+        assert name in dir(module)
+
+    with pytest.raises(AttributeError, match="has no attribute 'not_an_export'"):
+        module.not_an_export  # type: ignore[attr-defined]
@@ -0,0 +1,91 @@
+"""A test suite for the rate control module."""
+
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from comb_utils import ConcurrencyController, TokenBucket
+from tests.unit.utils import typechecked
+
+
+@pytest.mark.parametrize(
+    "latencies, expected_concurrency",
+    [
+        ([0.1], 1.5),
+        ([0.1, 0.2, 0.3], 2.5),
+        ([0.1] * 10, 3),
+        ([2.0], 1),
+        ([0.1, 0.1, 0.1, 0.1, 5.0], 3 * 0.5),
+    ],
+)
+@typechecked
+def test_aimd(latencies: list[float], expected_concurrency: float) -> None:
+    """Test the limit increases additively within target latency, and halves over it."""
+    controller = ConcurrencyController(target_latency_seconds=0.5, max_concurrency=3)
+    for latency in latencies:
+        controller.acquire()
+        controller.release(latency_seconds=latency)
+
+    assert controller.concurrency == max(expected_concurrency, 1)
+
+
+@typechecked
+def test_overload_trips_breaker() -> None:
+    """Test an overload cuts the limit and holds new calls until the breaker closes."""
+    controller = ConcurrencyController(target_latency_seconds=0.5, breaker_seconds=30)
+    controller.concurrency = 8
+
+    with patch("comb_utils.lib.rate_control.monotonic", return_value=100):
+        controller.acquire()
+        controller.release(latency_seconds=0.1, overloaded=True)
+        assert controller.concurrency == 4
+        assert controller.breaker_open
+
+    with patch("comb_utils.lib.rate_control.monotonic", return_value=130):
+        assert not controller.breaker_open
+        controller.acquire()
+        controller.release(latency_seconds=0.1)
+
+
+@typechecked
+def test_acquire_blocks_at_limit() -> None:
+    """Test a call waits for a free slot when the limit is reached."""
+    controller = ConcurrencyController(target_latency_seconds=0.5)
+    controller.acquire()
+
+    acquired: list[None] = []
+    waiter = Thread(target=lambda: acquired.append(controller.acquire()))
+    waiter.start()
+    waiter.join(timeout=0.05)
+    assert waiter.is_alive()
+    assert not acquired
+
+    controller.release(latency_seconds=1.0)
+    waiter.join(timeout=1)
+    assert not waiter.is_alive()
+    assert acquired
+
+
+@pytest.mark.parametrize(
+    "reserve_times, expected_waits",
+    [
+        ([0, 0], [0, 0]),
+        ([0, 0, 0, 0], [0, 0, 1, 2]),
+        ([0, 0, 0, 0, 3], [0, 0, 1, 2, 0]),
+        ([0, 0, 0, 0.5], [0, 0, 1, 1.5]),
+        ([0, 0, 10, 10, 10], [0, 0, 0, 0, 1]),
+    ],
+)
+@typechecked
+def test_token_bucket(reserve_times: list[float], expected_waits: list[float]) -> None:
+    """Test calls only wait once a burst empties the bucket, then wait for the refill."""
+    with patch("comb_utils.lib.rate_control.monotonic", return_value=0):
+        bucket = TokenBucket(rate_per_second=1, capacity=2)
+
+    waits = []
+    for reserve_time in reserve_times:
+        with patch("comb_utils.lib.rate_control.monotonic", return_value=reserve_time):
+            waits.append(bucket.reserve())
+
+    assert waits == pytest.approx(expected_waits)
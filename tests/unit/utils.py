@@ -0,0 +1,15 @@
+"""Helpers shared by the unit tests."""
+
+import os
+from collections.abc import Callable
+
+from typeguard import typechecked as _typechecked
+
+
+def _unchecked(func: Callable) -> Callable:
+    """Return the function without runtime type checking."""
+    return func
+
+
+#: Set COMB_UTILS_SKIP_TYPECHECK to skip type checking the tests themselves (e.g., in CI).
+typechecked = _unchecked if os.environ.get("COMB_UTILS_SKIP_TYPECHECK") else _typechecked